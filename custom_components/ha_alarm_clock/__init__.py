@@ -763,6 +763,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         # Create or reuse the shared coordinator (tests patch AlarmAndReminderCoordinator)
         coordinator = await _async_get_or_create_coordinator(hass)
+        # The coordinator outlives reloads, so its listeners are tied to the entry instead
+        entry.async_on_unload(coordinator.async_track_config_entry_changes())
 
         coordinator.set_default_media_player(entry.options.get(CONF_MEDIA_PLAYER))
         allowed_option = (
@@ -801,6 +803,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Let coordinator restore saved items if it supports it
         if hasattr(coordinator, "async_load_items"):
             await coordinator.async_load_items()
+            entry.async_on_unload(coordinator.async_cancel_restored_publish)
 
         # --- Service handlers (ensure services.yaml remains for UI metadata) ---
         def _extract_target(call: ServiceCall) -> tuple[str | None, bool | None]:
@@ -1098,6 +1101,8 @@ async def _async_handle_resolve_media_ws(hass, connection, msg):
         connection.send_error(msg["id"], "resolve_failed", str(err))
         return
 
+    connection.send_result(msg["id"], result.as_dict())
+
 
 @websocket_api.websocket_command(
     {
@@ -1111,6 +1116,3 @@ async def _async_handle_resolve_media_ws(hass, connection, msg):
 async def websocket_resolve_media_metadata(hass, connection, msg):
     """Resolve media metadata for HA Alarm Clock cards."""
     await _async_handle_resolve_media_ws(hass, connection, msg)
-
-
-    connection.send_result(msg["id"], result)
@@ -48,10 +48,7 @@ class StopAlarmTool(llm.Tool):
                 return {"error": "Alarm system coordinator not found"}
 
             # Find active alarms
-            active_alarms = [
-                item_id for item_id, item in coordinator._active_items.items()
-                if item.get("is_alarm") and item.get("status") == "active"
-            ]
+            active_alarms = coordinator.active_item_ids(True)
 
             if not active_alarms:
                 return {"error": "No alarm is currently ringing"}
@@ -128,10 +125,7 @@ class SnoozeAlarmTool(llm.Tool):
             )
 
             # Find active alarms
-            active_alarms = [
-                item_id for item_id, item in coordinator._active_items.items()
-                if item.get("is_alarm") and item.get("status") == "active"
-            ]
+            active_alarms = coordinator.active_item_ids(True)
 
             if not active_alarms:
                 return {"error": "No alarm is currently ringing"}
@@ -193,10 +187,7 @@ class StopReminderTool(llm.Tool):
                 return {"error": "Reminder system coordinator not found"}
 
             # Find active reminders
-            active_reminders = [
-                item_id for item_id, item in coordinator._active_items.items()
-                if not item.get("is_alarm") and item.get("status") == "active"
-            ]
+            active_reminders = coordinator.active_item_ids(False)
 
             if not active_reminders:
                 return {"error": "No reminder is currently ringing"}
@@ -275,10 +266,7 @@ class SnoozeReminderTool(llm.Tool):
             )
 
             # Find active reminders
-            active_reminders = [
-                item_id for item_id, item in coordinator._active_items.items()
-                if not item.get("is_alarm") and item.get("status") == "active"
-            ]
+            active_reminders = coordinator.active_item_ids(False)
 
             if not active_reminders:
                 return {"error": "No reminder is currently ringing"}
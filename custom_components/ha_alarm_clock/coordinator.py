@@ -3,21 +3,27 @@ from __future__ import annotations
 import logging
 import re
 import unicodedata
-from typing import Dict, Any, Callable, Optional, Iterable
+from typing import Dict, Any, Awaitable, Callable, Optional, Iterable
 from datetime import datetime, timedelta, time as dt_time
 import time
 import asyncio
 import contextlib
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
 from pathlib import Path
 from urllib.parse import urlparse, urljoin, unquote
 
-from homeassistant.core import HomeAssistant, ServiceCall, callback, Context
-from homeassistant.helpers.event import async_track_point_in_time, async_track_state_change_event
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, HassJob, ServiceCall, callback, Context
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.const import EVENT_CALL_SERVICE
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.network import get_url
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.start import async_at_started
+from homeassistant.config_entries import SIGNAL_CONFIG_ENTRY_CHANGED
 import voluptuous as vol
 from homeassistant.components import media_source
 from homeassistant.components.media_source import MediaSourceError
@@ -46,11 +52,98 @@ from .storage import AlarmReminderStorage
 
 _LOGGER = logging.getLogger(__name__)
 
-_DLNA_HASH_ID_PATTERN = re.compile(r"^:[0-9a-f]{32}$", re.IGNORECASE)
+_DLNA_HASH_ID_PATTERN = re.compile(r"^:[0-9a-f]{32}$", re.IGNORECASE | re.ASCII)
+_DLNA_HASH_ID_LENGTH = 33  # ":" followed by 32 hex digits
+# Cheap provider prefilter so unrelated ids are rejected before urlparse runs.
+_PROVIDER_ID_PREFIX_PATTERN = re.compile(r"^(?:media-source://(plex|jellyfin)|(plex)://)", re.IGNORECASE)
+_PLEX_METADATA_PREFIX = "library/metadata/"
+# Same rule as homeassistant.core.valid_entity_id, for lowercase input.
+_ENTITY_ID_PATTERN = re.compile(r"^(?!.+__)(?!_)[\da-z_]+(?<!_)\.(?!_)[\da-z_]+(?<!_)$")
+_SLUG_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
+_SLUG_COLLAPSE_RE = re.compile(r"_+")
+_HUMANIZE_SPACE_RE = re.compile(r"[_\s]+")
+_HUMANIZE_INITIAL_RE = re.compile(r"\b([a-z])")
+_NOTIFY_DOMAIN_PREFIX = "notify."
+_MOBILE_APP_PREFIX = "mobile_app_"
+# Stop reasons that need no suffix on the expiry reason of a one-off item
+_ROUTINE_STOP_REASONS = frozenset({"stopped", "snoozed"})
+# Stop reasons after which a repeating item is not advanced to its next occurrence
+_NO_RESCHEDULE_REASONS = frozenset({"snoozed", "deleted"})
+# Statuses that become "disabled" when an item is edited to enabled=False
+_DISABLEABLE_STATUSES = frozenset({"scheduled", "active", "expired"})
+# Same result as NFKD + ASCII-ignore for U+00C0..U+017F, without the normalization pass.
+_LATIN_TO_ASCII = {
+    code: unicodedata.normalize("NFKD", chr(code)).encode("ascii", "ignore").decode("ascii")
+    for code in range(0xC0, 0x180)
+}
+
+
+def _upper_match(match: re.Match) -> str:
+    return match.group(1).upper()
+
+
+@lru_cache(maxsize=1024)
+def _slugify_cached(value: str) -> str:
+    if not value.isascii():
+        # Latin-1/Latin Extended-A accents map straight to ASCII; anything else goes through NFKD.
+        value = value.translate(_LATIN_TO_ASCII)
+        if not value.isascii():
+            value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    lowered = value.lower()
+    replaced = _SLUG_NONALNUM_RE.sub("_", lowered)
+    collapsed = _SLUG_COLLAPSE_RE.sub("_", replaced)
+    return collapsed.strip("_")
+
+
+@lru_cache(maxsize=1024)
+def _humanize_cached(slug: str) -> str:
+    replaced = _HUMANIZE_SPACE_RE.sub(" ", slug).strip()
+    if not replaced:
+        return ""
+    return _HUMANIZE_INITIAL_RE.sub(_upper_match, replaced)
+
 
 __all__ = ["AlarmAndReminderCoordinator"]
 
 
+_RESOLVABLE_MEDIA_PROVIDERS = frozenset({"plex", "dlna_dms", "jellyfin"})
+
+
+@lru_cache(maxsize=512)
+def _detect_media_provider_cached(media_content_id: str) -> str | None:
+    if "://" not in media_content_id:
+        return None
+    lowered = media_content_id.lower()
+    if lowered.startswith("plex://"):
+        return "plex"
+    if not lowered.startswith(MEDIA_SOURCE_PREFIX):
+        return None
+    # The host ends at the first path, query or fragment delimiter, as in urlparse.
+    host = lowered[len(MEDIA_SOURCE_PREFIX):]
+    for delimiter in "/?#":
+        host = host.partition(delimiter)[0]
+    if host in _RESOLVABLE_MEDIA_PROVIDERS:
+        return host
+    return None
+
+
+@lru_cache(maxsize=512)
+def _cached_urlparse(value: str):
+    """Parse a media identifier once; ParseResult is immutable so sharing is safe."""
+    return urlparse(value)
+
+
+def _split_path_query(value: str) -> tuple[str, str]:
+    """Split the part after a URL's host into (path, query), dropping any fragment."""
+    value = value.partition("#")[0]
+    path, _, query = value.partition("?")
+    return path, query
+
+
+def _unquote_if_needed(value: str) -> str:
+    return unquote(value) if "%" in value else value
+
+
 WEEKDAY_NAME_TO_INDEX = {
     "mon": 0,
     "monday": 0,
@@ -80,12 +173,96 @@ WEEKDAY_INDEX_TO_NAME = [
     "sat",
     "sun",
 ]
-ALL_WEEKDAYS = {0, 1, 2, 3, 4, 5, 6}
+# Weekday sets are 7-bit masks: bit i is set when weekday i (Monday=0) is allowed.
+ALL_WEEKDAYS_MASK = 0b1111111
+_STATIC_REPEAT_WEEKDAY_MASKS: dict[str, int] = {
+    "daily": ALL_WEEKDAYS_MASK,
+    "weekdays": 0b0011111,
+    "weekends": 0b1100000,
+}
+
+
+@lru_cache(maxsize=512)
+def _parse_datetime_cached(value: str) -> datetime | None:
+    """dt_util.parse_datetime memoized by string; datetimes are immutable so sharing is safe."""
+    return dt_util.parse_datetime(value)
+
+
+def _notify_service_target(device_id: str) -> str:
+    """Map "notify.xxx", "mobile_app_xxx" or a bare device id to a notify service name."""
+    if device_id.startswith(_NOTIFY_DOMAIN_PREFIX):
+        return device_id[len(_NOTIFY_DOMAIN_PREFIX):]
+    if device_id.startswith(_MOBILE_APP_PREFIX):
+        return device_id
+    # Bare device id (e.g. 'sm_a528b'): assume the mobile_app_ prefix
+    return _MOBILE_APP_PREFIX + device_id
+
+
+def _ensure_local(value: datetime) -> datetime:
+    """dt_util.as_local, skipping the call for values already in the default zone."""
+    if value.tzinfo is dt_util.DEFAULT_TIME_ZONE:
+        return value
+    return dt_util.as_local(value)
+
+
+async def _async_run_coalesced(
+    inflight: dict[str, asyncio.Future],
+    key: str,
+    factory: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Await factory() once per key; callers arriving meanwhile share its outcome.
+
+    If the caller doing the work is cancelled, the callers that joined it are
+    not: they retry, and the first to get there takes the work over.
+    """
+    while (pending := inflight.get(key)) is not None:
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                raise
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    inflight[key] = future
+    try:
+        result = await factory()
+    except Exception as err:
+        future.set_exception(err)
+        # Mark retrieved so asyncio doesn't warn when nobody was waiting.
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del inflight[key]
+        if not future.done():
+            future.cancel()
+
+
+def _cheap_lower(value: str) -> str:
+    """Casefold only when needed; repeat values and day names are nearly always lowercase already."""
+    return value if value.islower() else value.casefold()
+
+
+@lru_cache(maxsize=128)
+def _repeat_days_mask(repeat_days: tuple[Any, ...]) -> int:
+    """Fold day names into a weekday bitmask; items share a handful of day lists."""
+    mask = 0
+    for raw_day in repeat_days:
+        if not isinstance(raw_day, str):
+            continue
+        index = WEEKDAY_NAME_TO_INDEX.get(_cheap_lower(raw_day.strip()))
+        if index is not None:
+            mask |= 1 << index
+    return mask
+
 
 MEDIA_SOURCE_PREFIX = "media-source://"
 LOCAL_MEDIA_PREFIX = "/media/"
 LOCAL_STATIC_PREFIX = "/local/"
-MUSIC_ASSISTANT_URI_SCHEMES = {
+MUSIC_ASSISTANT_URI_SCHEMES = frozenset({
     "mass",
     "ma",
     "library",
@@ -97,7 +274,188 @@ MUSIC_ASSISTANT_URI_SCHEMES = {
     "ytmusic",
     "qobuz",
     "deezer",
+})
+MEDIA_METADATA_CACHE_TTL = 300  # seconds
+MEDIA_METADATA_CACHE_MAX = 256
+JELLYFIN_ITEM_CACHE_TTL = 60  # seconds
+JELLYFIN_ITEM_CACHE_MAX = 128
+STORAGE_SAVE_DELAY = 5  # seconds; coalesces bursts of state transitions
+
+
+class _LazyStr:
+    """Defer building a log argument until a handler actually formats it."""
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any) -> None:
+        self._func = func
+        self._args = args
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args))
+
+
+_MEDIA_METADATA_SUMMARY_FIELDS = (
+    "provider",
+    "media_content_type",
+    "title",
+    "display_title",
+    "artist",
+    "album",
+    "duration",
+    "rating_key",
+)
+_PLEX_SNAPSHOT_ATTRS = (
+    "type",
+    "title",
+    "grandparentTitle",
+    "parentTitle",
+    "originalTitle",
+    "summary",
+    "duration",
+    "thumb",
+    "thumbUrl",
+    "ratingKey",
+)
+
+
+@dataclass(slots=True)
+class MediaMetadata:
+    """Normalized metadata for a resolved media item."""
+
+    provider: str
+    media_content_id: str
+    media_content_type: str | None
+    title: str | None
+    artist: str | None
+    album: str | None
+    thumb: str | None
+    display_title: str | None
+    duration: float | None = None
+    rating_key: str | None = None
+    grandparent_title: str | None = None
+    summary: str | None = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the websocket payload; unset fields are sent as None."""
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+def _key_variants(key: str) -> tuple[str, ...]:
+    """Return the casing variants tried for a Jellyfin field, original spelling first."""
+    return tuple(dict.fromkeys((key, key.lower(), key.upper(), key.capitalize())))
+
+
+# Casing variants for every field _normalize_jellyfin_metadata looks up.
+_JELLYFIN_KEY_VARIANTS: dict[str, tuple[str, ...]] = {
+    key: _key_variants(key)
+    for key in (
+        "AlbumArtist",
+        "AlbumArtists",
+        "Artists",
+        "ArtistItems",
+        "Contributor",
+        "Album",
+        "AlbumItems",
+        "Series",
+        "ParentAlbum",
+        "Name",
+        "OriginalTitle",
+        "artists",
+        "artist",
+        "album",
+        "title",
+    )
+}
+_JELLYFIN_LABEL_FIELDS = ("Name", "name", "Title", "title", "DisplayTitle", "displayTitle", "Label", "label")
+
+
+def _classify_display_type(normalized: str) -> tuple[bool, bool, bool, bool]:
+    """Return (track, album, playlist, artist) flags for a lowercased media type."""
+    if not normalized:
+        return False, False, False, False
+
+    is_track_like = (
+        normalized in {"track", "song", "audio", "music"}
+        or normalized.startswith(("audio/", "music/", "object.item.audioitem"))
+        or "musictrack" in normalized
+        or ":track" in normalized
+    )
+    is_album_like = "album" in normalized
+    is_playlist_like = "playlist" in normalized
+    is_artist_like = (
+        normalized == "artist"
+        or normalized.endswith(".musicartist")
+        or any(needle in normalized for needle in ("person.music", "container.person", "artist"))
+    )
+    return is_track_like, is_album_like, is_playlist_like, is_artist_like
+
+
+# Display-title classification by media type, seeded with the common values and
+# extended with each new type seen (up to a small cap).
+_DISPLAY_TYPE_FLAGS: dict[str, tuple[bool, bool, bool, bool]] = {
+    media_type: _classify_display_type(media_type)
+    for media_type in ("", "track", "song", "audio", "music", "album", "artist", "playlist")
 }
+_DISPLAY_TYPE_FLAGS_MAX = 128
+# DIDL-Lite attributes consulted when normalizing DLNA metadata.
+_DIDL_FIELDS = (
+    "title",
+    "artist",
+    "artists",
+    "album_artist",
+    "album_artists",
+    "creator",
+    "album",
+    "album_name",
+    "album_art_uri",
+    "duration",
+    "upnp_class",
+)
+# Ordered (source, key) lookups for DLNA fields; sources are "didl", "metadata" and "extra".
+_DLNA_ARTIST_LOOKUPS = (
+    ("didl", "artist"),
+    ("didl", "artists"),
+    ("didl", "album_artist"),
+    ("didl", "album_artists"),
+    ("didl", "creator"),
+    ("metadata", "artist"),
+    ("metadata", "artists"),
+    ("metadata", "album_artist"),
+    ("extra", "artist"),
+    ("extra", "artists"),
+    ("extra", "albumArtist"),
+    ("extra", "albumArtists"),
+    ("extra", "upnp:artist"),
+    ("extra", "upnp:author"),
+    ("extra", "dc:creator"),
+    ("extra", "dc:artist"),
+)
+_DLNA_ALBUM_LOOKUPS = (
+    ("didl", "album"),
+    ("didl", "album_name"),
+    ("metadata", "album"),
+    ("metadata", "album_name"),
+    ("extra", "album"),
+    ("extra", "albumName"),
+    ("extra", "upnp:album"),
+    ("extra", "dc:album"),
+)
+_DLNA_TITLE_LOOKUPS = (
+    ("metadata", "title"),
+    ("extra", "title"),
+    ("extra", "dc:title"),
+    ("extra", "upnp:title"),
+)
+# (path prefix, media-source path it maps to); None means already a media-source id.
+_MEDIA_SOURCE_PREFIX_MAP = (
+    (MEDIA_SOURCE_PREFIX, None),
+    (LOCAL_MEDIA_PREFIX, "media_source/"),
+    (LOCAL_STATIC_PREFIX, "media_source/local/"),
+)
+_STRIPPABLE_ID_DOMAINS = frozenset({ALARM_ENTITY_DOMAIN, REMINDER_ENTITY_DOMAIN, DOMAIN, "sensor"})
+# Item keys _serialize_item_state drops or recomputes instead of copying through.
+_SERIALIZE_SKIPPED_KEYS = frozenset({"media_players", ATTR_SPOTIFY_SOURCE, ATTR_VOLUME})
 
 
 class _PlaybackSession:
@@ -579,6 +937,26 @@ class _PlaybackSession:
         self._media_request_active = False
         self._last_target = None
         self._tts_active = False
+
+
+@dataclass(slots=True)
+class _ItemRuntime:
+    """Live handles for one item: pending trigger, stop signal and playback."""
+
+    cancel_trigger: Callable[[], None] | None = None
+    stop_event: asyncio.Event | None = None
+    playback_task: asyncio.Task | None = None
+    session: _PlaybackSession | None = None
+
+    def is_idle(self) -> bool:
+        return (
+            self.cancel_trigger is None
+            and self.stop_event is None
+            and self.playback_task is None
+            and self.session is None
+        )
+
+
 class AlarmAndReminderCoordinator:
     """Coordinates scheduling of alarms and reminders."""
 
@@ -587,17 +965,21 @@ class AlarmAndReminderCoordinator:
         self.hass = hass
         self.media_handler = media_handler
         self._active_items: Dict[str, Dict[str, Any]] = {}
-        self._stop_events: Dict[str, asyncio.Event] = {}
-        self._scheduled_callbacks: Dict[str, Callable[[], None]] = {}
-        self._playback_tasks: Dict[str, asyncio.Task] = {}
-        self._playback_sessions: Dict[str, _PlaybackSession] = {}
+        # Per-item trigger/playback handles, one lookup for all of them
+        self._runtime: Dict[str, _ItemRuntime] = {}
+        # One job for every scheduled trigger; per-item data travels as call args.
+        self._trigger_job = HassJob(
+            self._handle_scheduled_trigger,
+            f"{DOMAIN} trigger",
+            cancel_on_shutdown=True,
+        )
         self._last_alarm_time: Optional[datetime] = None
         self.async_add_entities = None
         self._alarm_counter = 0
         self._reminder_counter = 0
         self.storage = AlarmReminderStorage(hass)
         self._default_media_player: str | None = None
-        self._allowed_activation_entities: set[str] | None = None
+        self._allowed_activation_entities: frozenset[str] | None = None
         self._default_snooze_minutes: int = DEFAULT_SNOOZE_MINUTES
         self._active_press_mode: str = DEFAULT_ACTIVE_PRESS_MODE
         _LOGGER.debug("New coordinator instance created: %s", id(self))
@@ -622,17 +1004,46 @@ class AlarmAndReminderCoordinator:
         # Add these new methods
         self._used_alarm_ids = set()  # Track used alarm IDs
         self._used_reminder_ids = set()  # Track used reminder IDs
+        # Lowest counter not yet known to be taken, per id prefix and per name slug.
+        # Ids only leave _active_items through _pop_item, which lowers the hints
+        # again, so allocation returns the lowest free id exactly like a full scan.
+        self._next_id_hint: Dict[str, int] = {}
+        self._next_slug_hint: Dict[str, int] = {}
+        # Casefolded id -> stored id; rebuilt lazily when it falls out of sync
+        # with _active_items (other modules add/remove items directly).
+        self._casefold_index: Dict[str, str] = {}
+        # Lowercased name -> ordered ids carrying it; maintained by _put_item
+        self._name_index: Dict[str, Dict[str, None]] = {}
+        # Ids stored with status "active", in activation order; stale entries are pruned on read
+        self._active_ids: Dict[str, None] = {}
+        # Set while a coalesced dashboard refresh is queued on the loop
+        self._refresh_pending = False
+        self._pending_state_items: set[str] = set()
+        # Entity ids awaiting the next batched state-changed event
+        self._pending_changed: set[str] = set()
 
         # Notification action mapping: listen once globally and dispatch by tag
         self._notification_listener = hass.bus.async_listen(
             "mobile_app_notification_action", self._on_mobile_notification_action
         )
-        self._notification_tag_map: Dict[str, str] = {}  # tag -> item_id
 
-        # Cache media-player profiles so we can tailor playback behavior per platform.
-        self._media_player_profile_cache: Dict[str, Dict[str, Any]] = {}
+        # Media player profiles by entity id, with the state object they were built from.
+        self._media_player_profile_cache: Dict[str, tuple[Any, Dict[str, Any]]] = {}
         self._cached_base_url: str | None = None
-        self._resolved_media_metadata_cache: dict[str, tuple[float, Dict[str, Any]]] = {}
+        # LRU ordered: hits move to the end, overflow is evicted from the front.
+        self._resolved_media_metadata_cache: OrderedDict[str, tuple[float, MediaMetadata]] = OrderedDict()
+        # Loaded Jellyfin coordinator as (monotonic timestamp, coordinator); dropped on entry changes.
+        self._cached_jellyfin_coordinator: tuple[float, Any] | None = None
+        self._inflight_media_metadata: dict[str, asyncio.Future] = {}
+        # Raw Jellyfin items by item id as (monotonic expiry, item), LRU ordered.
+        self._jellyfin_item_cache: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._inflight_jellyfin_items: dict[str, asyncio.Future] = {}
+        # Bound concurrent mutagen probes so bulk descriptor builds don't flood the executor.
+        self._duration_probe_sem = asyncio.Semaphore(4)
+        # Bound concurrent descriptor restores so startup doesn't flood media resolvers.
+        self._restore_media_sem = asyncio.Semaphore(8)
+        # Pending startup publish of restored states, cancelled if the entry unloads first
+        self._unsub_publish_restored: CALLBACK_TYPE | None = None
 
         # Allow the media handler to reuse our player classification logic.
         if hasattr(self.media_handler, "set_media_player_profile_resolver"):
@@ -671,7 +1082,7 @@ class AlarmAndReminderCoordinator:
                     "Ignoring invalid activation entity '%s' in options.",
                     entity,
                 )
-        self._allowed_activation_entities = allowed
+        self._allowed_activation_entities = frozenset(allowed)
 
     def set_default_snooze_minutes(self, minutes: int | None) -> None:
         """Set the default snooze duration used when not provided explicitly."""
@@ -765,14 +1176,13 @@ class AlarmAndReminderCoordinator:
             _LOGGER.debug("Coordinator: get_url failed to resolve base URL: %s", err)
 
         config = self.hass.config
-        for attr in ("external_url", "internal_url"):
-            candidate = getattr(config, attr, None)
-            if candidate:
-                self._cached_base_url = str(candidate)
-                return self._cached_base_url
+        base = config.external_url or config.internal_url
+        if base:
+            self._cached_base_url = str(base)
+            return self._cached_base_url
 
-        api = getattr(config, "api", None)
-        base = getattr(api, "base_url", None) if api else None
+        api = config.api
+        base = api.base_url if api else None
         if base:
             self._cached_base_url = str(base)
             return self._cached_base_url
@@ -808,8 +1218,9 @@ class AlarmAndReminderCoordinator:
 
         resolved_url: str | None = None
         kind = "direct"
-        friendly_title = title
-        metadata_title = friendly_title.strip() if isinstance(friendly_title, str) and friendly_title.strip() else None
+        # Canonicalize the caller-supplied title once; everything below works on stripped text.
+        title_clean = title.strip() if isinstance(title, str) else ""
+        metadata_title = title_clean or None
         try:
             if media_source.is_media_source_id(content_id):
                 try:
@@ -821,9 +1232,11 @@ class AlarmAndReminderCoordinator:
                 if mime_type:
                     content_type = content_type or mime_type
                 kind = "media_source"
-                friendly_title = friendly_title or getattr(media, "title", None)
-                if metadata_title is None and isinstance(friendly_title, str) and friendly_title.strip():
-                    metadata_title = friendly_title.strip()
+                if not title_clean:
+                    media_title = getattr(media, "title", None)
+                    if isinstance(media_title, str):
+                        title_clean = media_title.strip()
+                        metadata_title = title_clean or None
             else:
                 resolved_url = content_id
                 parsed = urlparse(content_id)
@@ -854,8 +1267,9 @@ class AlarmAndReminderCoordinator:
 
         candidate_url = resolved_url or content_id
         duration = await self._probe_media_duration(candidate_url)
-        if not friendly_title:
-            friendly_title = self._friendly_media_title(content_id) or self._friendly_media_title(candidate_url)
+        if not title_clean:
+            fallback_title = self._friendly_media_title(content_id) or self._friendly_media_title(candidate_url)
+            title_clean = fallback_title or ""
         descriptor = {
             "kind": kind,
             "original_id": content_id,
@@ -865,13 +1279,9 @@ class AlarmAndReminderCoordinator:
             "media_content_id": content_id,
             "media_content_type": content_type or "music",
         }
-        if isinstance(friendly_title, str):
-            normalized_title = friendly_title.strip()
-        else:
-            normalized_title = None
-        if normalized_title:
+        if title_clean:
             descriptor["media_content_title"] = self._resolve_media_title(
-                normalized_title,
+                title_clean,
                 metadata_title=metadata_title,
                 content_id=content_id,
                 resolved_url=candidate_url,
@@ -883,9 +1293,7 @@ class AlarmAndReminderCoordinator:
         if not content_id:
             return content_id
 
-        if content_id.startswith("media/"):
-            content_id = f"/{content_id}"
-        elif content_id.startswith("local/"):
+        if content_id.startswith(("media/", "local/")):
             content_id = f"/{content_id}"
 
         if content_id.startswith(LOCAL_MEDIA_PREFIX):
@@ -973,29 +1381,29 @@ class AlarmAndReminderCoordinator:
         content_id: str | None,
         resolved_url: str | None,
     ) -> str:
-        """Return the preferred title for a media descriptor."""
-        trimmed = title.strip()
-        if not trimmed:
+        """Return the preferred title for a media descriptor.
+
+        Both ``title`` and ``metadata_title`` are expected to be stripped already.
+        """
+        if not title:
             return title
 
         if metadata_title:
-            meta_trimmed = metadata_title.strip()
-            if meta_trimmed:
-                reference_tokens = {
-                    token.strip().lower()
-                    for token in (
-                        self._friendly_media_title(content_id),
-                        self._friendly_media_title(resolved_url),
-                    )
-                    if token
-                }
-                meta_lower = meta_trimmed.lower()
-                meta_no_ext = meta_lower.rsplit(".", 1)[0] if "." in meta_lower else meta_lower
-                if meta_lower in reference_tokens or meta_no_ext in reference_tokens:
-                    return self._friendly_media_title(meta_trimmed) or meta_trimmed
-                return meta_trimmed
+            reference_tokens = {
+                token.lower()
+                for token in (
+                    self._friendly_media_title(content_id),
+                    self._friendly_media_title(resolved_url),
+                )
+                if token
+            }
+            meta_lower = metadata_title.lower()
+            meta_no_ext = meta_lower.rsplit(".", 1)[0] if "." in meta_lower else meta_lower
+            if meta_lower in reference_tokens or meta_no_ext in reference_tokens:
+                return self._friendly_media_title(metadata_title) or metadata_title
+            return metadata_title
 
-        return self._friendly_media_title(trimmed) or trimmed
+        return self._friendly_media_title(title) or title
 
     def _http_local_to_media_source_id(self, url: str) -> str | None:
         """Convert a Home Assistant-served HTTP URL into a media-source identifier."""
@@ -1054,16 +1462,13 @@ class AlarmAndReminderCoordinator:
         """Map legacy local paths to media-source identifiers."""
         if not candidate:
             return None
-        if candidate.startswith(MEDIA_SOURCE_PREFIX):
-            return candidate
-        if candidate.startswith(LOCAL_MEDIA_PREFIX):
-            rel_path = candidate[len(LOCAL_MEDIA_PREFIX):].lstrip("/")
-            if rel_path:
-                return f"{MEDIA_SOURCE_PREFIX}media_source/{rel_path}"
-        if candidate.startswith(LOCAL_STATIC_PREFIX):
-            rel_path = candidate[len(LOCAL_STATIC_PREFIX):].lstrip("/")
-            if rel_path:
-                return f"{MEDIA_SOURCE_PREFIX}media_source/local/{rel_path}"
+        for prefix, source_path in _MEDIA_SOURCE_PREFIX_MAP:
+            if not candidate.startswith(prefix):
+                continue
+            if source_path is None:
+                return candidate
+            rel_path = candidate[len(prefix):].lstrip("/")
+            return f"{MEDIA_SOURCE_PREFIX}{source_path}{rel_path}" if rel_path else None
         return None
 
     async def _ensure_streamable_local_media(
@@ -1071,7 +1476,11 @@ class AlarmAndReminderCoordinator:
         descriptor: Dict[str, Any],
         media_player: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Resolve local media paths to signed URLs when possible."""
+        """Resolve local media paths to signed URLs when possible.
+
+        The input descriptor is returned as-is when nothing needs rewriting; a
+        copy is only made once a field actually changes.
+        """
         if not isinstance(descriptor, dict):
             return descriptor
 
@@ -1133,7 +1542,9 @@ class AlarmAndReminderCoordinator:
         if not isinstance(descriptor, dict):
             return descriptor
 
-        normalized = dict(descriptor)
+        # Helpers below copy on write, so the common pass-through case (HTTP or
+        # Music Assistant URIs) never duplicates the descriptor.
+        normalized = descriptor
         classification = self._classify_media_descriptor(normalized)
 
         if classification in {"local_path", "ha_media_source"}:
@@ -1263,7 +1674,8 @@ class AlarmAndReminderCoordinator:
         path = self._map_url_to_local_path(url)
         if not path:
             return None
-        return await self.hass.async_add_executor_job(self._read_duration_with_mutagen, path)
+        async with self._duration_probe_sem:
+            return await self.hass.async_add_executor_job(self._read_duration_with_mutagen, path)
 
     @staticmethod
     def _read_duration_with_mutagen(path: Path) -> float | None:
@@ -1292,7 +1704,7 @@ class AlarmAndReminderCoordinator:
         media_content_id: str,
         media_content_type: str | None = None,
         provider_hint: str | None = None,
-    ) -> Dict[str, Any]:
+    ) -> MediaMetadata:
         """Resolve extended metadata for supported media providers."""
         if not media_content_id:
             raise HomeAssistantError("Missing media_content_id")
@@ -1311,7 +1723,7 @@ class AlarmAndReminderCoordinator:
         self,
         media_content_id: str,
         media_content_type: str | None = None,
-    ) -> Dict[str, Any]:
+    ) -> MediaMetadata:
         """Resolve additional Plex metadata for a media-source identifier."""
         _LOGGER.debug(
             "Plex resolver request: media_content_id=%s media_content_type=%s",
@@ -1333,8 +1745,8 @@ class AlarmAndReminderCoordinator:
 
         now = time.monotonic()
         cache_key = f"plex:{server_id}:{item_key}"
-        cached = self._resolved_media_metadata_cache.get(cache_key)
-        if cached and now - cached[0] < 300:
+        cached = self._get_cached_media_metadata(cache_key, now)
+        if cached:
             _LOGGER.debug(
                 "Plex metadata cache hit for %s (age=%.1fs)",
                 cache_key,
@@ -1369,13 +1781,14 @@ class AlarmAndReminderCoordinator:
                 self._snapshot_plex_item_attributes,
                 plex_item,
             )
-            _LOGGER.debug(
-                "Fetched Plex item: type=%s title=%s parent=%s grandparent=%s",
-                plex_item_data.get("type"),
-                plex_item_data.get("title"),
-                plex_item_data.get("parentTitle"),
-                plex_item_data.get("grandparentTitle"),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Fetched Plex item: type=%s title=%s parent=%s grandparent=%s",
+                    plex_item_data.get("type"),
+                    plex_item_data.get("title"),
+                    plex_item_data.get("parentTitle"),
+                    plex_item_data.get("grandparentTitle"),
+                )
         except Exception as err:  # noqa: BLE001
             raise HomeAssistantError("Unable to fetch Plex metadata") from err
 
@@ -1387,17 +1800,16 @@ class AlarmAndReminderCoordinator:
         )
         _LOGGER.debug(
             "Normalized Plex metadata: %s",
-            self._summarize_media_metadata(metadata),
+            _LazyStr(self._summarize_media_metadata, metadata),
         )
-        self._resolved_media_metadata_cache[cache_key] = (now, metadata)
-        self._prune_resolved_media_metadata_cache(now)
+        self._store_resolved_media_metadata(cache_key, now, metadata)
         return metadata
 
     async def async_resolve_dlna_media_metadata(
         self,
         media_content_id: str,
         media_content_type: str | None = None,
-    ) -> Dict[str, Any]:
+    ) -> MediaMetadata:
         """Resolve metadata for DLNA media-source identifiers."""
         _LOGGER.debug(
             "DLNA resolver request: media_content_id=%s media_content_type=%s",
@@ -1407,14 +1819,14 @@ class AlarmAndReminderCoordinator:
         if not media_source.is_media_source_id(media_content_id):
             raise HomeAssistantError("DLNA metadata resolution requires a media-source identifier")
 
-        parsed = urlparse(media_content_id)
+        parsed = _cached_urlparse(media_content_id)
         if (parsed.netloc or "").lower() != "dlna_dms":
             raise HomeAssistantError("Media identifier is not a DLNA media-source reference")
 
         now = time.monotonic()
         cache_key = f"dlna_dms:{media_content_id}"
-        cached = self._resolved_media_metadata_cache.get(cache_key)
-        if cached and now - cached[0] < 300:
+        cached = self._get_cached_media_metadata(cache_key, now)
+        if cached:
             _LOGGER.debug(
                 "DLNA metadata cache hit for %s (age=%.1fs)",
                 cache_key,
@@ -1455,34 +1867,37 @@ class AlarmAndReminderCoordinator:
         )
         _LOGGER.debug(
             "Normalized DLNA metadata: %s",
-            self._summarize_media_metadata(metadata),
+            _LazyStr(self._summarize_media_metadata, metadata),
         )
-        self._resolved_media_metadata_cache[cache_key] = (now, metadata)
-        self._prune_resolved_media_metadata_cache(now)
+        self._store_resolved_media_metadata(cache_key, now, metadata)
         return metadata
 
     async def async_resolve_jellyfin_media_metadata(
         self,
         media_content_id: str,
         media_content_type: str | None = None,
-    ) -> Dict[str, Any]:
+    ) -> MediaMetadata:
         """Resolve metadata for Jellyfin media-source identifiers."""
         _LOGGER.debug(
             "Jellyfin resolver request: media_content_id=%s media_content_type=%s",
             media_content_id,
             media_content_type,
         )
-        if not media_source.is_media_source_id(media_content_id):
+        if not media_content_id.startswith(MEDIA_SOURCE_PREFIX):
             raise HomeAssistantError("Jellyfin metadata resolution requires a media-source identifier")
 
-        parsed = urlparse(media_content_id)
-        if (parsed.netloc or "").lower() != "jellyfin":
+        match = _PROVIDER_ID_PREFIX_PATTERN.match(media_content_id)
+        if (
+            not match
+            or (match.group(1) or "").lower() != "jellyfin"
+            or media_content_id[match.end():match.end() + 1] not in ("", "/", "?", "#")
+        ):
             raise HomeAssistantError("Media identifier is not a Jellyfin media-source reference")
 
         now = time.monotonic()
         cache_key = f"jellyfin:{media_content_id}"
-        cached = self._resolved_media_metadata_cache.get(cache_key)
-        if cached and now - cached[0] < 300:
+        cached = self._get_cached_media_metadata(cache_key, now)
+        if cached:
             _LOGGER.debug(
                 "Jellyfin metadata cache hit for %s (age=%.1fs)",
                 cache_key,
@@ -1492,41 +1907,62 @@ class AlarmAndReminderCoordinator:
         else:
             _LOGGER.debug("Jellyfin metadata cache miss for %s", cache_key)
 
-        play_media = None
-        try:
-            play_media = await media_source.async_resolve_media(self.hass, media_content_id, None)
+        # Alarms sharing a media id often resolve it at the same moment; join any
+        # resolution already in flight instead of repeating the lookups.
+        if cache_key in self._inflight_media_metadata:
+            _LOGGER.debug("Jellyfin metadata request for %s joined in-flight resolution", cache_key)
+        return await _async_run_coalesced(
+            self._inflight_media_metadata,
+            cache_key,
+            partial(
+                self._async_resolve_jellyfin_media_metadata_uncached,
+                media_content_id,
+                media_content_type,
+                cache_key,
+                now,
+            ),
+        )
+
+    async def _async_resolve_jellyfin_media_metadata_uncached(
+        self,
+        media_content_id: str,
+        media_content_type: str | None,
+        cache_key: str,
+        now: float,
+    ) -> MediaMetadata:
+        # The three lookups are independent, so run them concurrently.
+        _LOGGER.debug("Jellyfin play/browse/raw item lookups starting for %s", media_content_id)
+        play_media, browse_media, jellyfin_item = await asyncio.gather(
+            media_source.async_resolve_media(self.hass, media_content_id, None),
+            media_source.async_browse_media(self.hass, media_content_id),
+            self._async_fetch_jellyfin_item(media_content_id),
+            return_exceptions=True,
+        )
+
+        if isinstance(play_media, BaseException):
+            self._log_jellyfin_lookup_error("play media resolve", play_media)
+            play_media = None
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Jellyfin play media resolved: mime=%s title=%s",
                 getattr(play_media, "mime_type", None),
                 getattr(play_media, "title", None),
             )
-        except MediaSourceError as err:
-            _LOGGER.debug("Jellyfin play media resolve failed (media source error): %s", err)
-        except HomeAssistantError as err:  # type: ignore[misc] - HA may raise its own error subclass
-            _LOGGER.debug("Jellyfin play media resolve raised HomeAssistantError: %s", err)
-        except Exception as err:  # noqa: BLE001 - instrumentation only
-            _LOGGER.debug("Jellyfin play media resolve raised unexpected error: %s", err)
 
-        try:
-            browse_media = await media_source.async_browse_media(self.hass, media_content_id)
+        if isinstance(browse_media, BaseException):
+            self._log_jellyfin_lookup_error("browse media lookup", browse_media)
+            browse_media = None
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Jellyfin browse media resolved: class=%s title=%s children=%s",
                 getattr(browse_media, "media_class", None),
                 getattr(browse_media, "title", None),
                 len(getattr(browse_media, "children", []) or []),
             )
-        except MediaSourceError as err:
-            browse_media = None
-            _LOGGER.debug("Jellyfin browse media lookup failed (media source error): %s", err)
-        except HomeAssistantError as err:  # type: ignore[misc]
-            browse_media = None
-            _LOGGER.debug("Jellyfin browse media lookup raised HomeAssistantError: %s", err)
-        except Exception as err:  # noqa: BLE001
-            browse_media = None
-            _LOGGER.debug("Jellyfin browse media lookup raised unexpected error: %s", err)
 
-        _LOGGER.debug("Jellyfin raw item fetch starting for %s", media_content_id)
-        jellyfin_item = await self._async_fetch_jellyfin_item(media_content_id)
+        if isinstance(jellyfin_item, BaseException):
+            self._log_jellyfin_lookup_error("raw item fetch", jellyfin_item)
+            jellyfin_item = None
         if jellyfin_item is None:
             _LOGGER.debug("Jellyfin raw item fetch returned no data; falling back to media_source metadata")
         metadata = self._normalize_jellyfin_metadata(
@@ -1538,69 +1974,103 @@ class AlarmAndReminderCoordinator:
         )
         _LOGGER.debug(
             "Normalized Jellyfin metadata: %s",
-            self._summarize_media_metadata(metadata),
+            _LazyStr(self._summarize_media_metadata, metadata),
         )
-        self._resolved_media_metadata_cache[cache_key] = (now, metadata)
-        self._prune_resolved_media_metadata_cache(now)
+        self._store_resolved_media_metadata(cache_key, now, metadata)
         return metadata
 
-    def _parse_plex_media_source_id(self, media_content_id: str) -> tuple[str, str]:
-        parsed = urlparse(media_content_id)
-        scheme = (parsed.scheme or "").lower()
+    @staticmethod
+    def _log_jellyfin_lookup_error(label: str, err: BaseException) -> None:
+        """Log a failed Jellyfin lookup collected by asyncio.gather."""
+        if not isinstance(err, Exception):
+            # Cancellation and friends must keep propagating.
+            raise err
+        if isinstance(err, MediaSourceError):
+            _LOGGER.debug("Jellyfin %s failed (media source error): %s", label, err)
+        elif isinstance(err, HomeAssistantError):
+            _LOGGER.debug("Jellyfin %s raised HomeAssistantError: %s", label, err)
+        else:
+            _LOGGER.debug("Jellyfin %s raised unexpected error: %s", label, err)
 
-        if scheme == "media-source" and parsed.netloc == "plex":
-            path = parsed.path.lstrip("/")
-            if not path or "/" not in path:
+    def _parse_plex_media_source_id(self, media_content_id: str) -> tuple[str, str]:
+        match = _PROVIDER_ID_PREFIX_PATTERN.match(media_content_id or "")
+        if not match or (match.group(1) or match.group(2)).lower() != "plex":
+            raise ValueError("media_content_id is not a Plex media-source reference")
+
+        remainder = media_content_id[match.end():]
+
+        if match.group(1):
+            # media-source://plex/<server>/<item path>[?query]
+            if remainder and remainder[0] not in "/?#":
+                raise ValueError("media_content_id is not a Plex media-source reference")
+            path, query = _split_path_query(remainder)
+            server_id, sep, item_path = path.lstrip("/").partition("/")
+            if not sep:
                 raise ValueError("Plex media-source id is missing the item key")
-
-            server_id, remainder = path.split("/", 1)
-            if not server_id or not remainder:
+            if not server_id or not item_path:
                 raise ValueError("Invalid Plex media-source identifier")
 
-            item_key = "/" + remainder
-            if parsed.query:
-                item_key = f"{item_key}?{parsed.query}"
-
-            server = unquote(server_id)
-            key = unquote(item_key)
+            item_key = f"/{item_path}?{query}" if query else f"/{item_path}"
+            server = _unquote_if_needed(server_id)
+            key = _unquote_if_needed(item_key)
             _LOGGER.debug("Plex identifier parsed via media-source scheme: server=%s key=%s", server, key)
             return server, key
 
-        if scheme == "plex":
-            server_id = parsed.netloc
-            if not server_id:
-                raise ValueError("Plex identifier is missing the server id")
-
-            remainder = parsed.path.lstrip("/")
-            if not remainder:
-                raise ValueError("Plex identifier is missing the item key")
-
-            if not remainder.startswith("library/metadata/"):
-                remainder = remainder.lstrip("/")
-                remainder = f"library/metadata/{remainder}"
-
-            item_key = "/" + remainder
-            if parsed.query:
-                item_key = f"{item_key}?{parsed.query}"
+        # Legacy plex://<server>/<item path>[?query]
+        path, query = _split_path_query(remainder)
+        server_id, _, item_path = path.partition("/")
+        if not server_id:
+            raise ValueError("Plex identifier is missing the server id")
 
-            server = unquote(server_id)
-            key = unquote(item_key)
-            _LOGGER.debug("Plex identifier parsed via legacy plex:// scheme: server=%s key=%s", server, key)
-            return server, key
+        item_path = item_path.lstrip("/")
+        if not item_path:
+            raise ValueError("Plex identifier is missing the item key")
 
-        raise ValueError("media_content_id is not a Plex media-source reference")
+        if item_path.startswith(_PLEX_METADATA_PREFIX):
+            item_key = "/" + item_path
+        else:
+            item_key = "/" + _PLEX_METADATA_PREFIX + item_path
+        if query:
+            item_key = f"{item_key}?{query}"
+        server = _unquote_if_needed(server_id)
+        key = _unquote_if_needed(item_key)
+        _LOGGER.debug("Plex identifier parsed via legacy plex:// scheme: server=%s key=%s", server, key)
+        return server, key
 
     def _parse_jellyfin_media_source_id(self, media_content_id: str) -> str:
-        parsed = urlparse(media_content_id)
-        scheme = (parsed.scheme or "").lower()
-        if scheme != "media-source" or (parsed.netloc or "").lower() != "jellyfin":
+        match = _PROVIDER_ID_PREFIX_PATTERN.match(media_content_id or "")
+        if not match or (match.group(1) or "").lower() != "jellyfin":
+            raise ValueError("media_content_id is not a Jellyfin media-source reference")
+        remainder = media_content_id[match.end():]
+        if remainder and remainder[0] not in "/?#":
             raise ValueError("media_content_id is not a Jellyfin media-source reference")
-        identifier = parsed.path.lstrip("/")
+        path, _ = _split_path_query(remainder)
+        identifier = path.lstrip("/")
         if not identifier:
             raise ValueError("Jellyfin media-source id is missing the item identifier")
-        return unquote(identifier)
+        return _unquote_if_needed(identifier)
+
+    @callback
+    def async_track_config_entry_changes(self) -> CALLBACK_TYPE:
+        """Subscribe to config entry changes; the caller owns the returned unsubscribe."""
+        return async_dispatcher_connect(
+            self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._on_config_entry_changed
+        )
+
+    @callback
+    def _on_config_entry_changed(self, change, entry) -> None:
+        """Forget the cached Jellyfin coordinator when a Jellyfin entry changes."""
+        if getattr(entry, "domain", None) == JELLYFIN_DOMAIN:
+            self._cached_jellyfin_coordinator = None
 
     async def _async_get_loaded_jellyfin_coordinator(self):
+        cached = self._cached_jellyfin_coordinator
+        if cached is not None:
+            cached_at, coordinator = cached
+            if time.monotonic() - cached_at < 60 and getattr(coordinator, "api_client", None) is not None:
+                return coordinator
+            self._cached_jellyfin_coordinator = None
+
         config_entries = getattr(self.hass, "config_entries", None)
         if not config_entries:
             _LOGGER.debug("Jellyfin metadata: config_entries manager unavailable")
@@ -1614,6 +2084,7 @@ class AlarmAndReminderCoordinator:
             coordinator = getattr(entry, "runtime_data", None)
             if coordinator is not None:
                 _LOGGER.debug("Jellyfin metadata: using coordinator from entry %s", entry.entry_id)
+                self._cached_jellyfin_coordinator = (time.monotonic(), coordinator)
                 return coordinator
         _LOGGER.debug("Jellyfin metadata: no loaded config entries with runtime_data")
         return None
@@ -1636,6 +2107,32 @@ class AlarmAndReminderCoordinator:
             _LOGGER.debug("Jellyfin API client missing on coordinator for metadata request")
             return None
 
+        now = time.monotonic()
+        cache = self._jellyfin_item_cache
+        cached = cache.get(item_id)
+        if cached is not None and now < cached[0]:
+            cache.move_to_end(item_id)
+            return cached[1]
+
+        async def _fetch() -> Dict[str, Any] | None:
+            item, cache_seconds = await self._async_get_jellyfin_item(jellyfin_api, item_id)
+            if item is not None:
+                cache[item_id] = (now + cache_seconds, item)
+                cache.move_to_end(item_id)
+                while len(cache) > JELLYFIN_ITEM_CACHE_MAX:
+                    cache.popitem(last=False)
+            return item
+
+        return await _async_run_coalesced(self._inflight_jellyfin_items, item_id, _fetch)
+
+    async def _async_get_jellyfin_item(
+        self, jellyfin_api, item_id: str
+    ) -> tuple[Dict[str, Any] | None, float]:
+        """Fetch a raw Jellyfin item and return it with its cache lifetime in seconds.
+
+        The Jellyfin client only hands back the decoded JSON body, so response
+        cache headers are unavailable and the lifetime is the fixed default.
+        """
         def _get_item() -> Dict[str, Any] | None:
             return jellyfin_api.get_item(item_id)
 
@@ -1643,20 +2140,21 @@ class AlarmAndReminderCoordinator:
             item = await self.hass.async_add_executor_job(_get_item)
         except Exception as err:  # noqa: BLE001
             _LOGGER.debug("Failed to fetch Jellyfin metadata for %s: %s", item_id, err)
-            return None
+            return None, 0
 
         if not isinstance(item, dict):
             _LOGGER.debug("Jellyfin metadata response for %s was not a mapping", item_id)
-            return None
-        _LOGGER.debug(
-            "Fetched Jellyfin metadata for %s: name=%s type=%s album=%s artist=%s",
-            item_id,
-            item.get("Name"),
-            item.get("Type"),
-            item.get("Album"),
-            (item.get("AlbumArtists") or item.get("Artists")),
-        )
-        return item
+            return None, 0
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Fetched Jellyfin metadata for %s: name=%s type=%s album=%s artist=%s",
+                item_id,
+                item.get("Name"),
+                item.get("Type"),
+                item.get("Album"),
+                (item.get("AlbumArtists") or item.get("Artists")),
+            )
+        return item, JELLYFIN_ITEM_CACHE_TTL
 
     def _normalize_plex_metadata(
         self,
@@ -1664,7 +2162,7 @@ class AlarmAndReminderCoordinator:
         plex_item_data: Dict[str, Any],
         media_content_id: str,
         media_content_type: str | None,
-    ) -> Dict[str, Any]:
+    ) -> MediaMetadata:
         plex_type = plex_item_data.get("type") or media_content_type or "audio"
         title = plex_item_data.get("title")
         grandparent = plex_item_data.get("grandparentTitle")
@@ -1682,24 +2180,20 @@ class AlarmAndReminderCoordinator:
         )
         display_title = self._build_display_title(plex_type, title, artist, album)
 
-        metadata: Dict[str, Any] = {
-            "provider": "plex",
-            "media_content_id": media_content_id,
-            "media_content_type": plex_type,
-            "title": title,
-            "artist": artist,
-            "album": album,
-            "grandparent_title": grandparent,
-            "summary": summary,
-            "thumb": thumb,
-            "display_title": display_title,
-        }
-        if duration is not None:
-            metadata["duration"] = duration
-        rating_key = plex_item_data.get("ratingKey")
-        if rating_key:
-            metadata["rating_key"] = rating_key
-        return metadata
+        return MediaMetadata(
+            provider="plex",
+            media_content_id=media_content_id,
+            media_content_type=plex_type,
+            title=title,
+            artist=artist,
+            album=album,
+            thumb=thumb,
+            display_title=display_title,
+            duration=duration,
+            rating_key=plex_item_data.get("ratingKey") or None,
+            grandparent_title=grandparent,
+            summary=summary,
+        )
 
     def _normalize_dlna_metadata(
         self,
@@ -1708,8 +2202,9 @@ class AlarmAndReminderCoordinator:
         media_content_id: str,
         media_content_type: str | None,
         child_track_hints: Dict[str, Any] | None = None,
-    ) -> Dict[str, Any]:
+    ) -> MediaMetadata:
         didl_metadata = getattr(play_media, "didl_metadata", None)
+        didl = self._snapshot_didl_fields(didl_metadata)
         extra_attrs = getattr(didl_metadata, "extra_attributes", None)
         extra_dict = extra_attrs if isinstance(extra_attrs, dict) else {}
         generic_metadata = getattr(play_media, "metadata", None)
@@ -1720,50 +2215,28 @@ class AlarmAndReminderCoordinator:
         browse_children_class = getattr(browse_media, "children_media_class", None) if browse_media else None
         browse_thumb = getattr(browse_media, "thumbnail", None) if browse_media else None
 
-        title = self._extract_first_string(
-            getattr(didl_metadata, "title", None) if didl_metadata else None,
-            getattr(play_media, "title", None),
-            metadata_dict.get("title"),
-            extra_dict.get("title"),
-            extra_dict.get("dc:title"),
-            extra_dict.get("upnp:title"),
-            browse_title,
-        ) or self._friendly_media_title(media_content_id)
+        sources = {"didl": didl, "metadata": metadata_dict, "extra": extra_dict}
+        title = self._extract_first_string(didl.get("title"))
+        if not title:
+            title = self._extract_first_string(getattr(play_media, "title", None))
+        if not title:
+            title = self._extract_first_string_from(
+                sources[source].get(key) for source, key in _DLNA_TITLE_LOOKUPS
+            )
+        title = title or self._extract_first_string(browse_title) or self._friendly_media_title(media_content_id)
 
         if self._looks_like_dlna_object_id(title) and browse_title:
             title = browse_title
 
-        artist = self._extract_first_string(
-            getattr(didl_metadata, "artist", None) if didl_metadata else None,
-            getattr(didl_metadata, "artists", None) if didl_metadata else None,
-            getattr(didl_metadata, "album_artist", None) if didl_metadata else None,
-            getattr(didl_metadata, "album_artists", None) if didl_metadata else None,
-            getattr(didl_metadata, "creator", None) if didl_metadata else None,
-            metadata_dict.get("artist"),
-            metadata_dict.get("artists"),
-            metadata_dict.get("album_artist"),
-            extra_dict.get("artist"),
-            extra_dict.get("artists"),
-            extra_dict.get("albumArtist"),
-            extra_dict.get("albumArtists"),
-            extra_dict.get("upnp:artist"),
-            extra_dict.get("upnp:author"),
-            extra_dict.get("dc:creator"),
-            extra_dict.get("dc:artist"),
+        # Generators stop at the first usable value, so later lookups are skipped.
+        artist = self._extract_first_string_from(
+            sources[source].get(key) for source, key in _DLNA_ARTIST_LOOKUPS
         )
-
-        album = self._extract_first_string(
-            getattr(didl_metadata, "album", None) if didl_metadata else None,
-            getattr(didl_metadata, "album_name", None) if didl_metadata else None,
-            metadata_dict.get("album"),
-            metadata_dict.get("album_name"),
-            extra_dict.get("album"),
-            extra_dict.get("albumName"),
-            extra_dict.get("upnp:album"),
-            extra_dict.get("dc:album"),
+        album = self._extract_first_string_from(
+            sources[source].get(key) for source, key in _DLNA_ALBUM_LOOKUPS
         )
 
-        dlna_type = self._extract_first_string(getattr(didl_metadata, "upnp_class", None) if didl_metadata else None)
+        dlna_type = self._extract_first_string(didl.get("upnp_class"))
         mime_type = getattr(play_media, "mime_type", None)
         resolved_type = dlna_type or mime_type or media_content_type or "music"
         browse_class = browse_media_class or browse_children_class
@@ -1774,13 +2247,13 @@ class AlarmAndReminderCoordinator:
                     resolved_type = normalized_class
 
         thumb = self._extract_first_string(
-            getattr(didl_metadata, "album_art_uri", None) if didl_metadata else None,
+            didl.get("album_art_uri"),
             extra_dict.get("albumArtURI"),
             extra_dict.get("album_art"),
             browse_thumb,
         )
 
-        duration = self._coerce_duration_seconds(getattr(didl_metadata, "duration", None) if didl_metadata else None)
+        duration = self._coerce_duration_seconds(didl.get("duration"))
 
         if not title and browse_title:
             title = browse_title
@@ -1804,19 +2277,17 @@ class AlarmAndReminderCoordinator:
 
         display_title = self._build_display_title(resolved_type, title, artist, album)
 
-        metadata: Dict[str, Any] = {
-            "provider": "dlna_dms",
-            "media_content_id": media_content_id,
-            "media_content_type": resolved_type,
-            "title": title,
-            "artist": artist,
-            "album": album,
-            "thumb": thumb,
-            "display_title": display_title or title,
-        }
-        if duration is not None:
-            metadata["duration"] = duration
-        return metadata
+        return MediaMetadata(
+            provider="dlna_dms",
+            media_content_id=media_content_id,
+            media_content_type=resolved_type,
+            title=title,
+            artist=artist,
+            album=album,
+            thumb=thumb,
+            display_title=display_title or title,
+            duration=duration,
+        )
 
     def _normalize_jellyfin_metadata(
         self,
@@ -1826,7 +2297,7 @@ class AlarmAndReminderCoordinator:
         media_content_type: str | None,
         *,
         raw_item: Dict[str, Any] | None = None,
-    ) -> Dict[str, Any]:
+    ) -> MediaMetadata:
         title = self._extract_first_string(
             getattr(play_media, "title", None),
             getattr(browse_media, "title", None) if browse_media else None,
@@ -1840,6 +2311,11 @@ class AlarmAndReminderCoordinator:
 
         raw_item = raw_item or self._extract_jellyfin_item(browse_media)
         item_metadata = getattr(play_media, "metadata", None)
+        # Check the sources once so the field lookups below can index them directly.
+        if type(raw_item) is not dict:
+            raw_item = {}
+        if type(item_metadata) is not dict:
+            item_metadata = {}
         resolved_artist = self._extract_first_string(
             self._jellyfin_first_named_field(raw_item, "AlbumArtist"),
             self._jellyfin_first_named_field(raw_item, "AlbumArtists"),
@@ -1857,13 +2333,14 @@ class AlarmAndReminderCoordinator:
             self._jellyfin_first_named_field(item_metadata, "album"),
         )
 
-        runtime_ticks = None
-        if isinstance(raw_item, dict):
-            runtime_ticks = raw_item.get("RunTimeTicks") or raw_item.get("RuntimeTicks")
-        if not runtime_ticks and isinstance(item_metadata, dict):
+        runtime_ticks = raw_item.get("RunTimeTicks") or raw_item.get("RuntimeTicks")
+        if not runtime_ticks:
             runtime_ticks = item_metadata.get("runtime") or item_metadata.get("duration")
         duration = None
-        if isinstance(runtime_ticks, (int, float)):
+        if isinstance(runtime_ticks, int):
+            # Jellyfin reports ticks as ints; round to whole seconds without a float detour.
+            duration = (runtime_ticks + 5_000_000) // 10_000_000 if runtime_ticks > 0 else None
+        elif isinstance(runtime_ticks, float):
             duration = int(round(runtime_ticks / 10_000_000)) if runtime_ticks > 0 else None
         elif isinstance(runtime_ticks, str):
             try:
@@ -1892,19 +2369,17 @@ class AlarmAndReminderCoordinator:
 
         display_title = self._build_display_title(resolved_type, title, resolved_artist, resolved_album)
 
-        metadata: Dict[str, Any] = {
-            "provider": "jellyfin",
-            "media_content_id": media_content_id,
-            "media_content_type": resolved_type,
-            "title": title,
-            "artist": resolved_artist,
-            "album": resolved_album,
-            "thumb": thumbnail,
-            "display_title": display_title or title,
-        }
-        if duration is not None:
-            metadata["duration"] = duration
-        return metadata
+        return MediaMetadata(
+            provider="jellyfin",
+            media_content_id=media_content_id,
+            media_content_type=resolved_type,
+            title=title,
+            artist=resolved_artist,
+            album=resolved_album,
+            thumb=thumbnail,
+            display_title=display_title or title,
+            duration=duration,
+        )
 
     @staticmethod
     def _extract_jellyfin_item(browse_media) -> Dict[str, Any] | None:
@@ -1932,12 +2407,10 @@ class AlarmAndReminderCoordinator:
         return None
 
     @staticmethod
-    def _jellyfin_first_named_field(source: Dict[str, Any] | None, key: str):
-        if source is None or not key:
+    def _jellyfin_first_named_field(source: Dict[str, Any], key: str):
+        if not source:
             return None
-        if not isinstance(source, dict):
-            return AlarmAndReminderCoordinator._jellyfin_first_named_value(source)
-        lookup_keys = {key, key.lower(), key.upper(), key.capitalize()}
+        lookup_keys = _JELLYFIN_KEY_VARIANTS.get(key) or _key_variants(key)
         candidate = None
         for lookup in lookup_keys:
             if lookup in source:
@@ -1955,10 +2428,12 @@ class AlarmAndReminderCoordinator:
         if isinstance(value, (int, float)):
             return str(value)
         if isinstance(value, dict):
-            for field in ("Name", "name", "Title", "title", "DisplayTitle", "displayTitle", "Label", "label"):
+            for field in _JELLYFIN_LABEL_FIELDS:
                 text = value.get(field)
-                if isinstance(text, str) and text.strip():
-                    return text.strip()
+                if isinstance(text, str):
+                    text = text.strip()
+                    if text:
+                        return text
         if isinstance(value, (list, tuple, set)):
             for entry in value:
                 text = AlarmAndReminderCoordinator._jellyfin_first_named_value(entry)
@@ -1974,38 +2449,12 @@ class AlarmAndReminderCoordinator:
         album: str | None,
     ) -> str | None:
         normalized = (media_type or "").strip().lower()
-
-        def _matches_any(value: str | None, *needles: str) -> bool:
-            if not value:
-                return False
-            lowered = value.lower()
-            return any(needle in lowered for needle in needles)
-
-        is_track_like = False
-        if normalized:
-            if normalized in {"track", "song", "audio", "music"}:
-                is_track_like = True
-            elif normalized.startswith("audio/") or normalized.startswith("music/"):
-                is_track_like = True
-            elif normalized.startswith("object.item.audioitem"):
-                is_track_like = True
-            elif "musictrack" in normalized or ":track" in normalized:
-                is_track_like = True
-
-        is_album_like = False
-        if normalized:
-            if normalized in {"album"}:
-                is_album_like = True
-            elif "album" in normalized or ":album" in normalized:
-                is_album_like = True
-
-        is_playlist_like = normalized in {"playlist"} or "playlist" in normalized
-        is_artist_like = False
-        if normalized:
-            if normalized == "artist" or normalized.endswith(".musicartist"):
-                is_artist_like = True
-            elif _matches_any(normalized, "person.music", "container.person", "artist"):
-                is_artist_like = True
+        flags = _DISPLAY_TYPE_FLAGS.get(normalized)
+        if flags is None:
+            flags = _classify_display_type(normalized)
+            if len(_DISPLAY_TYPE_FLAGS) < _DISPLAY_TYPE_FLAGS_MAX:
+                _DISPLAY_TYPE_FLAGS[normalized] = flags
+        is_track_like, is_album_like, is_playlist_like, is_artist_like = flags
 
         # prefer semantic titles depending on type
         base_title = title
@@ -2029,14 +2478,15 @@ class AlarmAndReminderCoordinator:
         else:
             result = base_title or title or artist or album
 
-        _LOGGER.debug(
-            "Display title computed: media_type=%s title=%s artist=%s album=%s -> %s",
-            media_type,
-            title,
-            artist,
-            album,
-            result,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Display title computed: media_type=%s title=%s artist=%s album=%s -> %s",
+                media_type,
+                title,
+                artist,
+                album,
+                result,
+            )
         return result
 
     @staticmethod
@@ -2044,7 +2494,8 @@ class AlarmAndReminderCoordinator:
         if not value or not isinstance(value, str):
             return False
         trimmed = value.strip()
-        if not trimmed:
+        # Real titles almost never have the exact hash shape; reject them before the regex.
+        if len(trimmed) != _DLNA_HASH_ID_LENGTH or trimmed[0] != ":":
             return False
         return bool(_DLNA_HASH_ID_PATTERN.match(trimmed))
 
@@ -2092,20 +2543,21 @@ class AlarmAndReminderCoordinator:
 
     def _extract_dlna_track_hints(self, play_media) -> Dict[str, Any] | None:
         didl_metadata = getattr(play_media, "didl_metadata", None)
-        extra_attrs = getattr(didl_metadata, "extra_attributes", None) if didl_metadata else None
+        didl = self._snapshot_didl_fields(didl_metadata)
+        extra_attrs = getattr(didl_metadata, "extra_attributes", None)
         extra_dict = extra_attrs if isinstance(extra_attrs, dict) else {}
 
         title = self._extract_first_string(
-            getattr(didl_metadata, "title", None) if didl_metadata else None,
+            didl.get("title"),
             getattr(play_media, "title", None),
         )
 
         artist = self._extract_first_string(
-            getattr(didl_metadata, "artist", None) if didl_metadata else None,
-            getattr(didl_metadata, "artists", None) if didl_metadata else None,
-            getattr(didl_metadata, "album_artist", None) if didl_metadata else None,
-            getattr(didl_metadata, "album_artists", None) if didl_metadata else None,
-            getattr(didl_metadata, "creator", None) if didl_metadata else None,
+            didl.get("artist"),
+            didl.get("artists"),
+            didl.get("album_artist"),
+            didl.get("album_artists"),
+            didl.get("creator"),
             extra_dict.get("artist"),
             extra_dict.get("artists"),
             extra_dict.get("albumArtist"),
@@ -2115,8 +2567,8 @@ class AlarmAndReminderCoordinator:
         )
 
         album = self._extract_first_string(
-            getattr(didl_metadata, "album", None) if didl_metadata else None,
-            getattr(didl_metadata, "album_name", None) if didl_metadata else None,
+            didl.get("album"),
+            didl.get("album_name"),
             extra_dict.get("album"),
             extra_dict.get("albumName"),
             extra_dict.get("upnp:album"),
@@ -2130,6 +2582,13 @@ class AlarmAndReminderCoordinator:
             "title": title,
         }
 
+    @staticmethod
+    def _snapshot_didl_fields(didl_metadata) -> Dict[str, Any]:
+        """Read the DIDL-Lite fields we care about in a single pass."""
+        if not didl_metadata:
+            return {}
+        return {field: getattr(didl_metadata, field, None) for field in _DIDL_FIELDS}
+
     @staticmethod
     def _build_plex_thumb_url(plex_server, thumb_value: str | None, thumb_url: str | None) -> str | None:
         if not thumb_value and thumb_url:
@@ -2149,22 +2608,19 @@ class AlarmAndReminderCoordinator:
             except Exception:  # noqa: BLE001
                 return None
 
-        snapshot = {
-            "type": _safe_get("type"),
-            "title": _safe_get("title"),
-            "grandparentTitle": _safe_get("grandparentTitle"),
-            "parentTitle": _safe_get("parentTitle"),
-            "originalTitle": _safe_get("originalTitle"),
-            "summary": _safe_get("summary"),
-            "duration": _safe_get("duration"),
-            "thumb": _safe_get("thumb"),
-            "thumbUrl": _safe_get("thumbUrl"),
-            "ratingKey": _safe_get("ratingKey"),
-        }
-        return {key: value for key, value in snapshot.items() if value is not None}
+        snapshot: Dict[str, Any] = {}
+        for attr in _PLEX_SNAPSHOT_ATTRS:
+            value = _safe_get(attr)
+            if value is not None:
+                snapshot[attr] = value
+        return snapshot
 
     @staticmethod
     def _extract_first_string(*values: Any) -> str | None:
+        return AlarmAndReminderCoordinator._extract_first_string_from(values)
+
+    @staticmethod
+    def _extract_first_string_from(values: Iterable[Any]) -> str | None:
         for value in values:
             text = AlarmAndReminderCoordinator._coerce_didl_text(value)
             if text:
@@ -2173,27 +2629,34 @@ class AlarmAndReminderCoordinator:
 
     @staticmethod
     def _coerce_didl_text(value: Any) -> str | None:
-        if value is None:
-            return None
-        if isinstance(value, str):
-            text = value.strip()
-            return text or None
-        if isinstance(value, (list, tuple, set)):
-            for entry in value:
-                text = AlarmAndReminderCoordinator._coerce_didl_text(entry)
+        # Depth-first walk with an explicit stack; entries are (value, stringify) where
+        # stringify marks the str(value) fallback queued after an object's attributes.
+        stack: list[tuple[Any, bool]] = [(value, False)]
+        while stack:
+            current, stringify = stack.pop()
+            if current is None:
+                continue
+            if stringify:
+                try:
+                    text = str(current).strip()
+                except Exception:  # noqa: BLE001
+                    continue
                 if text:
                     return text
-            return None
-        for attr in ("value", "text", "name"):
-            if hasattr(value, attr):
-                text = AlarmAndReminderCoordinator._coerce_didl_text(getattr(value, attr))
+                continue
+            if isinstance(current, str):
+                text = current.strip()
                 if text:
                     return text
-        try:
-            text = str(value).strip()
-        except Exception:  # noqa: BLE001
-            return None
-        return text or None
+                continue
+            if isinstance(current, (list, tuple, set)):
+                stack.extend((entry, False) for entry in reversed(list(current)))
+                continue
+            stack.append((current, True))
+            for attr in ("name", "text", "value"):
+                if hasattr(current, attr):
+                    stack.append((getattr(current, attr), False))
+        return None
 
     @staticmethod
     def _coerce_duration_seconds(value: Any) -> int | None:
@@ -2203,46 +2666,59 @@ class AlarmAndReminderCoordinator:
             duration = int(round(value))
             return duration if duration >= 0 else None
         if isinstance(value, str):
-            parts = value.strip().split(":")
-            if not parts or any(part == "" for part in parts):
+            text = value.strip()
+            if text.isascii() and text.isdigit():
+                return int(text)
+            parts = text.split(":")
+            if "" in parts:
                 return None
+            hours = minutes = "0"
+            if len(parts) >= 3:
+                hours, minutes, seconds = parts[-3:]
+            elif len(parts) == 2:
+                minutes, seconds = parts
+            else:
+                seconds = parts[0]
             try:
-                parts = [int(float(part)) for part in parts]
+                total = int(hours) * 3600 + int(minutes) * 60 + int(seconds)
             except ValueError:
-                return None
-            while len(parts) < 3:
-                parts.insert(0, 0)
-            hours, minutes, seconds = parts[-3:]
-            total = hours * 3600 + minutes * 60 + seconds
+                # Fractional components such as "0:03:25.500" are truncated.
+                try:
+                    total = int(float(hours)) * 3600 + int(float(minutes)) * 60 + int(float(seconds))
+                except ValueError:
+                    return None
             return total if total >= 0 else None
         return None
 
-    def _prune_resolved_media_metadata_cache(self, now: float) -> None:
-        stale_keys = [
-            key
-            for key, (timestamp, _) in self._resolved_media_metadata_cache.items()
-            if now - timestamp > 900
-        ]
-        for key in stale_keys:
-            self._resolved_media_metadata_cache.pop(key, None)
-            _LOGGER.debug("Evicted stale media metadata cache entry: %s", key)
+    def _get_cached_media_metadata(self, cache_key: str, now: float) -> tuple[float, MediaMetadata] | None:
+        """Return a fresh (timestamp, metadata) cache entry and mark it recently used."""
+        cache = self._resolved_media_metadata_cache
+        cached = cache.get(cache_key)
+        if cached is None or now - cached[0] >= MEDIA_METADATA_CACHE_TTL:
+            return None
+        cache.move_to_end(cache_key)
+        return cached
+
+    def _store_resolved_media_metadata(self, cache_key: str, now: float, metadata: MediaMetadata) -> None:
+        """Cache resolved metadata, evicting least recently used entries past the cap."""
+        cache = self._resolved_media_metadata_cache
+        cache[cache_key] = (now, metadata)
+        cache.move_to_end(cache_key)
+        while len(cache) > MEDIA_METADATA_CACHE_MAX:
+            evicted, _ = cache.popitem(last=False)
+            _LOGGER.debug("Evicted media metadata cache entry: %s", evicted)
 
     @staticmethod
-    def _summarize_media_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
-        if not isinstance(metadata, dict):
+    def _summarize_media_metadata(metadata: MediaMetadata) -> Dict[str, Any]:
+        if not isinstance(metadata, MediaMetadata):
             return {"raw": metadata}
-        summary = {
-            "provider": metadata.get("provider"),
-            "media_content_type": metadata.get("media_content_type"),
-            "title": metadata.get("title"),
-            "display_title": metadata.get("display_title"),
-            "artist": metadata.get("artist"),
-            "album": metadata.get("album"),
-            "duration": metadata.get("duration"),
-            "rating_key": metadata.get("rating_key"),
-            "has_thumb": bool(metadata.get("thumb")),
-        }
-        return {key: value for key, value in summary.items() if value is not None}
+        summary: Dict[str, Any] = {}
+        for field in _MEDIA_METADATA_SUMMARY_FIELDS:
+            value = getattr(metadata, field)
+            if value is not None:
+                summary[field] = value
+        summary["has_thumb"] = bool(metadata.thumb)
+        return summary
 
     @staticmethod
     def _normalize_media_provider(value: str | None) -> str | None:
@@ -2255,32 +2731,16 @@ class AlarmAndReminderCoordinator:
     def _detect_media_provider(media_content_id: str | None) -> str | None:
         if not media_content_id or not isinstance(media_content_id, str):
             return None
-        lowered = media_content_id.lower()
-        try:
-            parsed = urlparse(media_content_id)
-        except ValueError:
-            parsed = None
-        scheme = (parsed.scheme or "").lower() if parsed else ""
-        netloc = (parsed.netloc or "").lower() if parsed else ""
-        if scheme == "plex" or (scheme == "media-source" and netloc == "plex"):
-            return "plex"
-        if scheme == "media-source" and netloc == "dlna_dms":
-            return "dlna_dms"
-        if scheme == "media-source" and netloc == "jellyfin":
-            return "jellyfin"
-        if lowered.startswith("media-source://dlna_dms/"):
-            return "dlna_dms"
-        if lowered.startswith("media-source://jellyfin/"):
-            return "jellyfin"
-        return None
+        return _detect_media_provider_cached(media_content_id)
 
 
     def _get_next_available_id(self, prefix: str) -> str:
         """Get next available ID for alarms."""
-        counter = 1
+        counter = self._next_id_hint.get(prefix, 1)
         while True:
             potential_id = f"{prefix}_{counter}"
             if potential_id not in self._active_items:
+                self._next_id_hint[prefix] = counter
                 return potential_id
             counter += 1
 
@@ -2289,12 +2749,7 @@ class AlarmAndReminderCoordinator:
         """Convert a user-provided name into a Home Assistant-safe slug."""
         if not isinstance(value, str):
             return ""
-        normalized = unicodedata.normalize("NFKD", value)
-        ascii_only = normalized.encode("ascii", "ignore").decode("ascii")
-        lowered = ascii_only.lower()
-        replaced = re.sub(r"[^a-z0-9]+", "_", lowered)
-        collapsed = re.sub(r"_+", "_", replaced)
-        return collapsed.strip("_")
+        return _slugify_cached(value)
 
     def _unique_name_slug(self, base_slug: str, prefix: str) -> str:
         """Ensure the generated slug is unique among active items."""
@@ -2302,27 +2757,85 @@ class AlarmAndReminderCoordinator:
             return self._get_next_available_id(prefix)
         if base_slug not in self._active_items:
             return base_slug
-        counter = 2
+        counter = self._next_slug_hint.get(base_slug, 2)
         while True:
             candidate = f"{base_slug}_{counter}"
             if candidate not in self._active_items:
+                self._next_slug_hint[base_slug] = counter
                 return candidate
             counter += 1
 
+    def _put_item(self, item_id: str, item: Dict[str, Any]) -> None:
+        """Store an item and keep the per-type id sets and casefold index in sync."""
+        if self._active_items.get(item_id) is not item:
+            self._active_items[item_id] = item
+            if item.get("is_alarm"):
+                self._used_alarm_ids.add(item_id)
+            else:
+                self._used_reminder_ids.add(item_id)
+            if isinstance(item_id, str):
+                self._casefold_index.setdefault(item_id.casefold(), item_id)
+        # The same dict may have been renamed or activated in place, so these are always refreshed
+        name = item.get("name")
+        if isinstance(name, str):
+            self._name_index.setdefault(name.lower(), {})[item_id] = None
+        if item.get("status") == "active":
+            self._active_ids[item_id] = None
+
+    def _pop_item(self, item_id: str) -> None:
+        """Remove an item and free its id for reuse; the counterpart of _put_item."""
+        self._active_items.pop(item_id, None)
+        self._used_alarm_ids.discard(item_id)
+        self._used_reminder_ids.discard(item_id)
+        self._release_id_hint(item_id)
+
+    def _item_ids_named(self, lowered_name: str) -> list[str]:
+        """Return ids of active items whose lowercased name matches, in insertion order.
+
+        Index entries go stale on rename or delete; they are dropped here on read.
+        """
+        ids = self._name_index.get(lowered_name)
+        if not ids:
+            return []
+        live = []
+        for candidate_id in ids:
+            item = self._active_items.get(candidate_id)
+            name = item.get("name") if item else None
+            if isinstance(name, str) and name.lower() == lowered_name:
+                live.append(candidate_id)
+        if len(live) != len(ids):
+            if live:
+                self._name_index[lowered_name] = dict.fromkeys(live)
+            else:
+                del self._name_index[lowered_name]
+        return live
+
+    def _release_id_hint(self, item_id: str) -> None:
+        """Let a freed numbered id be handed out again."""
+        base, sep, suffix = item_id.rpartition("_")
+        if not sep or not suffix.isdigit():
+            return
+        counter = int(suffix)
+        # "alarm_3" may have come from either allocator, so lower both hints;
+        # numbered slugs start at 2 and ids at 1
+        for hints, first in ((self._next_id_hint, 1), (self._next_slug_hint, 2)):
+            hint = hints.get(base)
+            if hint is not None and first <= counter < hint:
+                hints[base] = counter
+
     @staticmethod
     def _humanize_name(slug: str) -> str:
         """Return a human-friendly version of a slugified name."""
         if not isinstance(slug, str) or not slug:
             return ""
-        replaced = re.sub(r"[_\s]+", " ", slug).strip()
-        if not replaced:
-            return ""
-        return re.sub(r"\b([a-z])", lambda match: match.group(1).upper(), replaced)
+        return _humanize_cached(slug)
 
     def _normalize_media_player(self, value) -> Optional[str]:
         """Normalize media_player input to a single entity_id string or None."""
         if not value:
             return None
+        if type(value) is str:
+            return value
 
         # Handle dict structures like {"entity_id": "..."} or {"entity_ids": [...]}
         if isinstance(value, dict):
@@ -2345,7 +2858,10 @@ class AlarmAndReminderCoordinator:
     @staticmethod
     def _normalize_spotify_source_value(value: Any) -> str | None:
         """Normalize a spotify_source input into a clean string or None."""
-        if value in (None, "", False):
+        if isinstance(value, str):
+            candidate = value.strip()
+            return candidate or None
+        if value in (None, False):
             return None
         candidate = str(value).strip()
         return candidate or None
@@ -2355,13 +2871,17 @@ class AlarmAndReminderCoordinator:
         if not media_player:
             return []
 
-        def _extend_sources(container, results: list[str]) -> None:
+        collected: list[str] = []
+        seen: set[str] = set()
+
+        def _extend_sources(container) -> None:
             if not container:
                 return
             if isinstance(container, str):
                 normalized = self._normalize_spotify_source_value(container)
-                if normalized and normalized not in results:
-                    results.append(normalized)
+                if normalized and normalized not in seen:
+                    seen.add(normalized)
+                    collected.append(normalized)
                 return
             if isinstance(container, dict):
                 values = container.values()
@@ -2373,17 +2893,17 @@ class AlarmAndReminderCoordinator:
                 return
             for entry in iterator:
                 normalized = self._normalize_spotify_source_value(entry)
-                if normalized and normalized not in results:
-                    results.append(normalized)
+                if normalized and normalized not in seen:
+                    seen.add(normalized)
+                    collected.append(normalized)
 
-        collected: list[str] = []
         state = self.hass.states.get(media_player)
-        attrs = state.attributes if state and state.attributes else {}
-        _extend_sources(attrs.get("source_list"), collected)
+        if state is not None:
+            _extend_sources(state.attributes.get("source_list"))
 
         profile = self.get_media_player_profile(media_player)
         profile_attrs = profile.get("attributes") or {}
-        _extend_sources(profile_attrs.get("source_list"), collected)
+        _extend_sources(profile_attrs.get("source_list"))
 
         return collected
 
@@ -2433,7 +2953,7 @@ class AlarmAndReminderCoordinator:
         return normalized_source
 
     def get_media_player_profile(self, entity_id: Optional[str]) -> Dict[str, Any]:
-        """Return cached media player profile details for downstream logic."""
+        """Return media player profile details for downstream logic."""
         if not entity_id:
             return {
                 "entity_id": None,
@@ -2443,16 +2963,19 @@ class AlarmAndReminderCoordinator:
                 "attributes": {},
             }
 
-        profile = self._media_player_profile_cache.get(entity_id)
-        if profile:
-            return profile
+        # States are replaced on every change, so an identical state object means
+        # nothing the profile reads has changed since it was built.
+        state = self.hass.states.get(entity_id)
+        cached = self._media_player_profile_cache.get(entity_id)
+        if cached is not None and cached[0] is state:
+            return cached[1]
 
         registry = er.async_get(self.hass)
         entry = registry.async_get(entity_id)
         platform = entry.platform if entry else None
 
-        state = self.hass.states.get(entity_id)
-        attributes = dict(state.attributes) if state and state.attributes else {}
+        # State attributes are already read-only, so they are shared rather than copied.
+        attributes = state.attributes if state else {}
 
         mass_player_type = attributes.get("mass_player_type")
         mass_provider = attributes.get("mass_provider")
@@ -2476,8 +2999,7 @@ class AlarmAndReminderCoordinator:
             "mass_player_type": mass_player_type,
             "attributes": attributes,
         }
-
-        self._media_player_profile_cache[entity_id] = profile
+        self._media_player_profile_cache[entity_id] = (state, profile)
         return profile
 
     def _normalize_activation_entity(
@@ -2506,18 +3028,22 @@ class AlarmAndReminderCoordinator:
         if not candidate_str:
             return None
 
-        try:
-            entity_id = cv.entity_id(candidate_str)
-        except vol.Invalid as err:
-            message = f"Invalid activation entity: {candidate_str}"
-            if enforce_allowed:
-                raise ValueError(message) from err
-            _LOGGER.warning(
-                "%s on item %s; clearing field.",
-                message,
-                item_name or "<unknown>",
-            )
-            return None
+        if _ENTITY_ID_PATTERN.match(candidate_str):
+            # Already a valid lowercase entity id; cv.entity_id would return it unchanged.
+            entity_id = candidate_str
+        else:
+            try:
+                entity_id = cv.entity_id(candidate_str)
+            except vol.Invalid as err:
+                message = f"Invalid activation entity: {candidate_str}"
+                if enforce_allowed:
+                    raise ValueError(message) from err
+                _LOGGER.warning(
+                    "%s on item %s; clearing field.",
+                    message,
+                    item_name or "<unknown>",
+                )
+                return None
 
         if (
             self._allowed_activation_entities is not None
@@ -2556,9 +3082,12 @@ class AlarmAndReminderCoordinator:
             return min(1.0, number / 100.0)
         return 1.0
 
-    def _normalize_item_fields(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize internal representation of an alarm/reminder item."""
-        normalized = dict(item)
+    def _normalize_item_fields(self, item: Dict[str, Any], *, in_place: bool = False) -> Dict[str, Any]:
+        """Normalize internal representation of an alarm/reminder item.
+
+        Pass in_place=True when the caller owns ``item`` and would replace it with the result anyway.
+        """
+        normalized = item if in_place else dict(item)
         # Consolidate media player field (legacy data may contain media_players list)
         legacy_media_players = normalized.pop("media_players", None)
         if "media_player" not in normalized and legacy_media_players is not None:
@@ -2571,18 +3100,18 @@ class AlarmAndReminderCoordinator:
             if default_player:
                 normalized["media_player"] = default_player
 
-        # Normalize scheduled_time
+        # Normalize scheduled_time; stored items only ever hold datetimes (or None) after this
         sched = normalized.get("scheduled_time")
         if isinstance(sched, str):
             try:
-                normalized["scheduled_time"] = dt_util.parse_datetime(sched)
+                normalized["scheduled_time"] = _parse_datetime_cached(sched)
             except Exception:
                 pass
 
         sched_dt = normalized.get("scheduled_time")
         if isinstance(sched_dt, datetime):
             try:
-                normalized["scheduled_time"] = dt_util.as_local(sched_dt)
+                normalized["scheduled_time"] = _ensure_local(sched_dt)
             except Exception:
                 normalized["scheduled_time"] = sched_dt
             sched_dt = normalized["scheduled_time"]
@@ -2591,7 +3120,7 @@ class AlarmAndReminderCoordinator:
         canonical_dt: datetime | None = None
         if isinstance(canonical, str):
             try:
-                canonical_dt = dt_util.parse_datetime(canonical)
+                canonical_dt = _parse_datetime_cached(canonical)
             except Exception:
                 canonical_dt = None
         elif isinstance(canonical, datetime):
@@ -2599,7 +3128,7 @@ class AlarmAndReminderCoordinator:
 
         if isinstance(canonical_dt, datetime):
             try:
-                canonical_dt = dt_util.as_local(canonical_dt)
+                canonical_dt = _ensure_local(canonical_dt)
             except Exception:
                 pass
         else:
@@ -2610,14 +3139,14 @@ class AlarmAndReminderCoordinator:
         # Normalize repeat fields
         repeat_value = normalized.get("repeat", "once")
         if isinstance(repeat_value, str):
-            repeat_value = repeat_value.lower()
+            repeat_value = _cheap_lower(repeat_value)
         repeat_days = normalized.get("repeat_days")
         if repeat_days is None:
             repeat_days = []
         elif not isinstance(repeat_days, list):
             repeat_days = list(repeat_days)
         normalized["repeat_days"] = [
-            str(day).strip().lower()
+            _cheap_lower(str(day).strip())
             for day in repeat_days
             if day is not None and str(day).strip()
         ]
@@ -2626,7 +3155,7 @@ class AlarmAndReminderCoordinator:
             weekday_index: int | None = None
             scheduled_dt = normalized.get("scheduled_time")
             if isinstance(scheduled_dt, datetime):
-                weekday_index = dt_util.as_local(scheduled_dt).weekday()
+                weekday_index = _ensure_local(scheduled_dt).weekday()
             elif normalized["repeat_days"]:
                 weekday_index = WEEKDAY_NAME_TO_INDEX.get(normalized["repeat_days"][0])
 
@@ -2726,26 +3255,18 @@ class AlarmAndReminderCoordinator:
         repeat: str,
         repeat_days: list[str] | None,
         base_weekday: int,
-    ) -> set[int] | None:
-        """Return the set of weekdays an item should run on for a repeat pattern."""
-        repeat_key = (repeat or "once").lower()
+    ) -> int | None:
+        """Return the weekday bitmask an item should run on for a repeat pattern."""
+        repeat_key = _cheap_lower(repeat or "once")
         if repeat_key == "once":
             return None
-        if repeat_key == "daily":
-            return set(ALL_WEEKDAYS)
-        if repeat_key == "weekdays":
-            return {0, 1, 2, 3, 4}
-        if repeat_key == "weekends":
-            return {5, 6}
+        static_mask = _STATIC_REPEAT_WEEKDAY_MASKS.get(repeat_key)
+        if static_mask is not None:
+            return static_mask
         if repeat_key == "custom":
-            resolved: set[int] = set()
+            resolved = 0
             if repeat_days:
-                for raw_day in repeat_days:
-                    if not isinstance(raw_day, str):
-                        continue
-                    day = raw_day.strip().lower()
-                    if day in WEEKDAY_NAME_TO_INDEX:
-                        resolved.add(WEEKDAY_NAME_TO_INDEX[day])
+                resolved = _repeat_days_mask(tuple(repeat_days))
             if not resolved:
                 _LOGGER.warning("Custom repeat configured without valid repeat_days; treating as once")
                 return None
@@ -2755,21 +3276,21 @@ class AlarmAndReminderCoordinator:
     def _next_matching_weekday(
         self,
         candidate: datetime,
-        allowed_days: set[int] | None,
+        allowed_mask: int | None,
         *,
         include_today: bool,
     ) -> datetime | None:
         """Advance candidate to the next date whose weekday is allowed."""
-        if not allowed_days or allowed_days == ALL_WEEKDAYS:
+        if not allowed_mask or allowed_mask == ALL_WEEKDAYS_MASK:
             return candidate
         cursor = candidate
         check_today = include_today
         for _ in range(7):
-            if check_today and cursor.weekday() in allowed_days:
+            if check_today and (allowed_mask >> cursor.weekday()) & 1:
                 return cursor
             cursor += timedelta(days=1)
             check_today = True
-            if cursor.weekday() in allowed_days:
+            if (allowed_mask >> cursor.weekday()) & 1:
                 return cursor
         return None
 
@@ -2786,16 +3307,16 @@ class AlarmAndReminderCoordinator:
         if not isinstance(scheduled_time, datetime):
             return None
 
-        candidate = dt_util.as_local(scheduled_time)
-        reference_point = dt_util.as_local(reference or dt_util.now())
+        candidate = _ensure_local(scheduled_time)
+        reference_point = _ensure_local(reference or dt_util.now())
 
-        repeat_key = (repeat or "once").lower()
-        allowed_days = self._resolve_repeat_weekdays(repeat_key, repeat_days or [], candidate.weekday())
-        if repeat_key == "custom" and not allowed_days:
+        repeat_key = _cheap_lower(repeat or "once")
+        allowed_mask = self._resolve_repeat_weekdays(repeat_key, repeat_days or [], candidate.weekday())
+        if repeat_key == "custom" and not allowed_mask:
             repeat_key = "once"
 
         # Align to an allowed weekday before comparing to the reference.
-        aligned = self._next_matching_weekday(candidate, allowed_days, include_today=True)
+        aligned = self._next_matching_weekday(candidate, allowed_mask, include_today=True)
         if aligned is None:
             return None
         candidate = aligned
@@ -2811,46 +3332,58 @@ class AlarmAndReminderCoordinator:
         if force_advance and candidate > reference_point:
             reference_point = candidate
 
+        # Jump straight to the reference date: every earlier local date is in the past,
+        # so walking there one day at a time only repeated the weekday alignment.
+        gap_days = (reference_point.date() - candidate.date()).days
+        if gap_days > 0:
+            aligned = self._next_matching_weekday(
+                candidate + timedelta(days=gap_days), allowed_mask, include_today=True
+            )
+            if aligned is None:
+                return None
+            candidate = aligned
+
         # Bump forward until the scheduled time is in the future relative to reference.
         while candidate <= reference_point:
             candidate = candidate + timedelta(days=1)
-            aligned = self._next_matching_weekday(candidate, allowed_days, include_today=True)
+            aligned = self._next_matching_weekday(candidate, allowed_mask, include_today=True)
             if aligned is None:
                 return None
             candidate = aligned
 
         return candidate
 
+    def _serialize_shared_fields(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert the fields both the item state and the dashboard summary expose."""
+        sched = item.get("scheduled_time")
+        repeat_days = item.get("repeat_days")
+        activation_entity = item.get("activation_entity")
+        return {
+            "scheduled_time": sched.isoformat() if isinstance(sched, datetime) else sched,
+            "media_player": self._normalize_media_player(item.get("media_player")),
+            "repeat_days": [] if repeat_days is None else repeat_days,
+            "announce_time": bool(item.get("announce_time", True)),
+            "activation_entity": None if activation_entity in ("", None) else activation_entity,
+        }
+
     def _serialize_item_state(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Return attributes dict safe for Home Assistant state machine."""
-        data = dict(item)
-        sched = data.get("scheduled_time")
-        if isinstance(sched, datetime):
-            data["scheduled_time"] = sched.isoformat()
+        # Copy in one pass, leaving out keys that are dropped or rebuilt below.
+        data = {key: value for key, value in item.items() if key not in _SERIALIZE_SKIPPED_KEYS}
+        data.update(self._serialize_shared_fields(item))
         canonical = data.get("scheduled_time_canonical")
         if isinstance(canonical, datetime):
             data["scheduled_time_canonical"] = canonical.isoformat()
-        data["media_player"] = self._normalize_media_player(data.get("media_player"))
-        data.pop("media_players", None)
-        if data.get("repeat_days") is None:
-            data["repeat_days"] = []
-        data["announce_time"] = bool(data.get("announce_time", True))
         if data.get("is_alarm"):
             data["announce_name"] = bool(data.get("announce_name", True))
         else:
             data["announce_name"] = True
-        if data.get("activation_entity") in ("", None):
-            data["activation_entity"] = None
-        spotify_source = self._normalize_spotify_source_value(data.get(ATTR_SPOTIFY_SOURCE))
+        spotify_source = self._normalize_spotify_source_value(item.get(ATTR_SPOTIFY_SOURCE))
         if spotify_source:
             data[ATTR_SPOTIFY_SOURCE] = spotify_source
-        else:
-            data.pop(ATTR_SPOTIFY_SOURCE, None)
-        volume_override = self._normalize_volume_override(data.get(ATTR_VOLUME))
+        volume_override = self._normalize_volume_override(item.get(ATTR_VOLUME))
         if volume_override is not None:
             data[ATTR_VOLUME] = volume_override
-        else:
-            data.pop(ATTR_VOLUME, None)
         return data
 
     def _build_announcement_text(self, item: Dict[str, Any]) -> Optional[str]:
@@ -2864,7 +3397,8 @@ class AlarmAndReminderCoordinator:
             announce_name_enabled = bool(item.get("announce_name", True))
 
         if name:
-            slug = name.replace(" ", "_").lower()
+            # Names are normally stored slugified already; only transform when they aren't.
+            slug = name if " " not in name and name.islower() else name.replace(" ", "_").lower()
             default_prefix = "alarm_" if is_alarm else "reminder_"
             if not is_alarm:
                 display_name = self._humanize_name(name)
@@ -2875,15 +3409,17 @@ class AlarmAndReminderCoordinator:
         elif not is_alarm and display_name:
             parts.append(f"Time to {display_name}.")
         if item.get("announce_time", True):
-            current_time = dt_util.now().strftime("%I:%M %p").lstrip("0")
-            parts.append(f"It's {current_time}")
+            now = dt_util.now()
+            hour_12 = now.hour % 12 or 12
+            meridiem = "AM" if now.hour < 12 else "PM"
+            parts.append(f"It's {hour_12}:{now.minute:02d} {meridiem}")
         message = (item.get("message") or "").strip()
         if message:
             parts.append(message)
-        announcement = " ".join(part.strip() for part in parts if part).strip()
-        return announcement or None
+        # Every part is already stripped and non-empty, so the join needs no cleanup.
+        return " ".join(parts) or None
 
-    def _write_item_state(self, item_id: str) -> None:
+    def _write_item_state(self, item_id: str, *, fire_event: bool = True) -> None:
         """Push current item data into its individual HA entity."""
         item = self._active_items.get(item_id)
         if not item:
@@ -2891,8 +3427,12 @@ class AlarmAndReminderCoordinator:
         state = item.get("status", "scheduled")
         attributes = self._serialize_item_state(item)
         entity_id = self._entity_id_for_item(item_id, item)
+        current = self.hass.states.get(entity_id)
+        if current is not None and current.state == state and current.attributes == attributes:
+            return
         self.hass.states.async_set(entity_id, state, attributes)
-        self._fire_state_event(entity_id)
+        if fire_event:
+            self._fire_state_event(entity_id)
 
     def _fire_state_event(
         self,
@@ -2900,7 +3440,15 @@ class AlarmAndReminderCoordinator:
         *,
         action: str = "updated",
     ) -> None:
-        """Send a state-changed event for dashboards and switches."""
+        """Send a state-changed event for dashboards and switches.
+
+        Per-entity updates are batched into one event per loop iteration.
+        """
+        if entity_id and action == "updated":
+            if not self._pending_changed:
+                self.hass.loop.call_soon(self._flush_changed_entities)
+            self._pending_changed.add(entity_id)
+            return
         payload = {"action": action}
         if entity_id:
             payload["entity_id"] = entity_id
@@ -2909,10 +3457,48 @@ class AlarmAndReminderCoordinator:
             payload,
         )
 
+    @callback
+    def _flush_changed_entities(self) -> None:
+        """Fire one updated event listing every entity changed since the last flush."""
+        if not self._pending_changed:
+            return
+        entity_ids = sorted(self._pending_changed)
+        self._pending_changed.clear()
+        payload: Dict[str, Any] = {"action": "updated", "entity_ids": entity_ids}
+        if len(entity_ids) == 1:
+            payload["entity_id"] = entity_ids[0]
+        self.hass.bus.async_fire(f"{DOMAIN}_state_changed", payload)
+
     def _broadcast_state_refresh(self, action: str = "updated") -> None:
         """Fire change events for dashboards and switches."""
         self._fire_state_event(None, action=action)
 
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Refresh the dashboard and broadcast once per loop iteration."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.hass.loop.call_soon(self._flush_refresh)
+
+    @callback
+    def _mark_state_dirty(self, item_id: str) -> None:
+        """Queue an item's entity write for the next coalesced refresh."""
+        self._pending_state_items.add(item_id)
+        self._schedule_refresh()
+
+    @callback
+    def _flush_refresh(self) -> None:
+        """Run the coalesced entity writes, dashboard update and broadcast."""
+        self._refresh_pending = False
+        pending = self._pending_state_items
+        if pending:
+            self._pending_state_items = set()
+            for item_id in pending:
+                self._write_item_state(item_id)
+        self._update_dashboard_state()
+        self._broadcast_state_refresh()
+
     async def _mark_item_expired(self, item_id: str, *, reason: str | None = None) -> None:
         """Mark an item as expired because its scheduled time is in the past."""
         item = self._active_items.get(item_id)
@@ -2922,16 +3508,18 @@ class AlarmAndReminderCoordinator:
             return
         item["status"] = "expired"
         item.setdefault("enabled", True)
-        self._active_items[item_id] = self._normalize_item_fields(item)
-        await self.storage.async_save(self._active_items)
-        self._write_item_state(item_id)
-        self._update_dashboard_state()
-        self._broadcast_state_refresh()
+        self._put_item(item_id, self._normalize_item_fields(item, in_place=True))
+        self._schedule_save()
+        self._mark_state_dirty(item_id)
         msg = f"Marked {item_id} as expired"
         if reason:
             msg += f": {reason}"
         _LOGGER.info(msg)
 
+    def _summarize_active_items(self) -> Dict[str, Dict[str, Any]]:
+        """Return id -> name/status for debug logging."""
+        return {k: {"name": v.get("name"), "status": v.get("status")} for k, v in self._active_items.items()}
+
     def _bump_last_alarm_time(self, scheduled_time: Optional[datetime]) -> None:
         """Track most recent alarm scheduling for default picker."""
         if scheduled_time and (
@@ -2954,20 +3542,18 @@ class AlarmAndReminderCoordinator:
     @staticmethod
     def _strip_domain(item_id: str) -> str:
         """Normalize an id by removing any known domain prefixes."""
-        for prefix in (
-            f"{ALARM_ENTITY_DOMAIN}.",
-            f"{REMINDER_ENTITY_DOMAIN}.",
-            f"{DOMAIN}.",
-            "sensor.",
-        ):
-            if item_id.startswith(prefix):
-                return item_id.split(".")[-1]
+        head, sep, _ = item_id.partition(".")
+        if sep and head in _STRIPPABLE_ID_DOMAINS:
+            return item_id.rpartition(".")[2]
         return item_id
 
     def _resolve_active_item_id(self, item_id: str | None) -> str | None:
         """Return the stored active-item identifier for a given raw id."""
         if item_id is None:
             return None
+        # Callers usually pass the exact stored id
+        if item_id in self._active_items:
+            return item_id
 
         if isinstance(item_id, str):
             stripped = self._strip_domain(item_id)
@@ -2978,15 +3564,43 @@ class AlarmAndReminderCoordinator:
             return stripped
 
         if isinstance(stripped, str):
-            lowered = stripped.casefold()
-            for existing_id in self._active_items.keys():
-                if isinstance(existing_id, str) and existing_id.casefold() == lowered:
-                    return existing_id
+            lowered = stripped if stripped.isascii() and stripped.islower() else stripped.casefold()
+            existing_id = self._casefold_index.get(lowered)
+            if existing_id is None or existing_id not in self._active_items:
+                self._rebuild_casefold_index()
+                existing_id = self._casefold_index.get(lowered)
+            return existing_id
 
         return None
+
+    def _rebuild_casefold_index(self) -> None:
+        """Recompute the casefolded id index; first stored id wins on collisions."""
+        index: Dict[str, str] = {}
+        for existing_id in self._active_items:
+            if isinstance(existing_id, str):
+                index.setdefault(existing_id.casefold(), existing_id)
+        self._casefold_index = index
+
+    def _item_runtime(self, item_id: str) -> _ItemRuntime:
+        """Return the runtime handles for an item, creating them if needed."""
+        runtime = self._runtime.get(item_id)
+        if runtime is None:
+            runtime = self._runtime[item_id] = _ItemRuntime()
+        return runtime
+
+    def _prune_runtime(self, item_id: str, runtime: _ItemRuntime) -> None:
+        """Drop an item's runtime entry once it holds no handles."""
+        if runtime.is_idle() and self._runtime.get(item_id) is runtime:
+            del self._runtime[item_id]
+
     def _cancel_scheduled_trigger(self, item_id: str) -> None:
         """Cancel any scheduled callback for an item."""
-        remove = self._scheduled_callbacks.pop(item_id, None)
+        runtime = self._runtime.get(item_id)
+        if runtime is None or runtime.cancel_trigger is None:
+            return
+        remove = runtime.cancel_trigger
+        runtime.cancel_trigger = None
+        self._prune_runtime(item_id, runtime)
         if remove:
             try:
                 remove()
@@ -3000,48 +3614,144 @@ class AlarmAndReminderCoordinator:
             _LOGGER.warning("Cannot schedule %s, invalid scheduled_time: %s", item_id, scheduled_time)
             return
 
-        scheduled_time = dt_util.as_local(scheduled_time)
-        now = dt_util.now()
+        if scheduled_time.tzinfo is None:
+            scheduled_time = _ensure_local(scheduled_time)
+        # Epoch timestamps give a DST-safe delay without converting aware times.
+        delay = scheduled_time.timestamp() - time.time()
 
         # If already due, trigger immediately.
-        if scheduled_time <= now:
+        if delay <= 0:
             _LOGGER.debug(
                 "Scheduled time for %s (%s) is in the past; triggering immediately",
                 item_id,
                 scheduled_time.isoformat(),
             )
             self._cancel_scheduled_trigger(item_id)
-            self.hass.async_create_task(self._trigger_item(item_id))
+            self.hass.async_create_task(self._trigger_item(item_id), eager_start=True)
             return
 
         # Cancel any previous registration.
         self._cancel_scheduled_trigger(item_id)
 
-        @callback
-        def _handle(now_dt: datetime, iid: str = item_id) -> None:
-            _LOGGER.debug(
-                "Trigger fired for %s at %s (scheduled for %s)",
-                iid,
-                now_dt.isoformat(),
-                scheduled_time.isoformat(),
-            )
-            self._scheduled_callbacks.pop(iid, None)
-            self.hass.async_create_task(self._trigger_item(iid))
-
-        remove = async_track_point_in_time(self.hass, _handle, scheduled_time)
-        self._scheduled_callbacks[item_id] = remove
+        loop = self.hass.loop
+        handle = loop.call_at(
+            loop.time() + delay,
+            self.hass.async_run_hass_job,
+            self._trigger_job,
+            item_id,
+            scheduled_time,
+        )
+        self._item_runtime(item_id).cancel_trigger = handle.cancel
         _LOGGER.debug(
             "Registered trigger for %s at %s",
             item_id,
             scheduled_time.isoformat(),
         )
 
+    async def _handle_scheduled_trigger(self, item_id: str, scheduled_time: datetime) -> None:
+        """Start an item whose scheduled trigger has fired.
+
+        As a coroutine job HA runs this as an eager task, so the trigger starts without
+        a second task hop.
+        """
+        _LOGGER.debug("Trigger fired for %s (scheduled for %s)", item_id, scheduled_time)
+        runtime = self._runtime.get(item_id)
+        if runtime is not None:
+            runtime.cancel_trigger = None
+        await self._trigger_item(item_id)
+
+    def active_item_ids(self, is_alarm: bool) -> list[str]:
+        """Return ids of ringing alarms or reminders, oldest activation first."""
+        live = []
+        for item_id in list(self._active_ids):
+            item = self._active_items.get(item_id)
+            if item is None or item.get("status") != "active":
+                del self._active_ids[item_id]
+            elif bool(item.get("is_alarm")) == is_alarm:
+                live.append(item_id)
+        return live
+
+    def get_first_active(self, is_alarm: bool) -> str | None:
+        """Return the id of the first ringing alarm or reminder, if any."""
+        ids = self.active_item_ids(is_alarm)
+        return ids[0] if ids else None
+
     def get_default_alarm_time(self) -> dt_time:
         """Return default alarm time (last scheduled or 07:00)."""
         if self._last_alarm_time:
             return self._last_alarm_time.time()
         return dt_time(7, 0)
 
+    @callback
+    def _schedule_save(self) -> None:
+        """Queue a debounced write of _active_items; bursts share a single save."""
+        self.storage.async_delay_save(self._snapshot_items_for_storage, STORAGE_SAVE_DELAY)
+
+    def _snapshot_items_for_storage(self) -> Dict[str, Dict[str, Any]]:
+        """Return a shallow copy of _active_items taken when the Store writes."""
+        return dict(self._active_items)
+
+    async def _restore_item_media(self, item_id: str) -> None:
+        """Rebuild and validate a restored item's sound descriptor."""
+        item = self._active_items.get(item_id)
+        if item is None:
+            return
+        async with self._restore_media_sem:
+            descriptor: Dict[str, Any] | None
+            if not isinstance(item.get("sound_media"), dict):
+                try:
+                    descriptor = await self._prepare_sound_descriptor(
+                        item.get("sound_file"),
+                        is_alarm=item.get("is_alarm", False),
+                    )
+                except Exception as err:
+                    _LOGGER.error("Failed to normalize media for %s: %s", item_id, err)
+                    descriptor = await self._default_sound_descriptor(item.get("is_alarm", False))
+            else:
+                descriptor = dict(item["sound_media"])
+
+            # Items are normalized after restore, so resolve legacy media_players here.
+            raw_player = item["media_player"] if "media_player" in item else item.get("media_players")
+            media_player_target = self._normalize_media_player(raw_player) or self.get_default_media_player()
+            if descriptor is not None:
+                try:
+                    descriptor = await self._ensure_media_player_media_compatibility(
+                        media_player_target,
+                        descriptor,
+                    )
+                except ValueError as err:
+                    _LOGGER.warning(
+                        "Media '%s' incompatible with %s during restore: %s. Falling back to default.",
+                        descriptor.get("original_id") or descriptor.get("resolved_url"),
+                        media_player_target,
+                        err,
+                    )
+                    descriptor = await self._default_sound_descriptor(item.get("is_alarm", False))
+
+                item["sound_media"] = descriptor
+                playback_id = self._select_media_identifier_for_player(
+                    descriptor,
+                    media_player_target,
+                )
+                if playback_id:
+                    item["sound_file"] = playback_id
+
+    @callback
+    def _publish_restored_states(self, item_ids: list[str], _hass: HomeAssistant) -> None:
+        """Write restored entity states, then refresh the dashboard once."""
+        self._unsub_publish_restored = None
+        for item_id in item_ids:
+            # The single broadcast from the refresh covers every restored item
+            self._write_item_state(item_id, fire_event=False)
+        self._schedule_refresh()
+
+    @callback
+    def async_cancel_restored_publish(self) -> None:
+        """Drop a restored-state publish still waiting for startup to finish."""
+        if self._unsub_publish_restored is not None:
+            self._unsub_publish_restored()
+            self._unsub_publish_restored = None
+
     async def async_load_items(self) -> None:
         """Load items from storage and restore internal state (called at startup)."""
         try:
@@ -3049,83 +3759,62 @@ class AlarmAndReminderCoordinator:
             self._active_items = await self.storage.async_load()
             _LOGGER.debug("Loaded items from storage: %s", self._active_items)
 
-            # Rebuild used id sets
-            self._used_alarm_ids = {iid for iid, it in self._active_items.items() if it.get("is_alarm")}
-            self._used_reminder_ids = {iid for iid, it in self._active_items.items() if not it.get("is_alarm")}
+            # Own the item dicts (storage keeps references to the loaded data) and
+            # rebuild the id indexes in the same pass
+            loaded = self._active_items
+            self._active_items = {}
+            self._used_alarm_ids = set()
+            self._used_reminder_ids = set()
+            self._next_id_hint.clear()
+            self._next_slug_hint.clear()
+            self._casefold_index.clear()
+            self._name_index.clear()
+            self._active_ids.clear()
+            for item_id, item in loaded.items():
+                item = dict(item)
+                # Parse schedule strings now so handlers never see them, even while media restores
+                for key in ("scheduled_time", "scheduled_time_canonical"):
+                    value = item.get(key)
+                    if isinstance(value, str):
+                        try:
+                            item[key] = _parse_datetime_cached(value)
+                        except ValueError:
+                            item[key] = None
+                self._put_item(item_id, item)
+
+            # Media resolution is independent per item, so restore descriptors concurrently.
+            restore_ids = list(self._active_items)
+            results = await asyncio.gather(
+                *(self._restore_item_media(item_id) for item_id in restore_ids),
+                return_exceptions=True,
+            )
+            for item_id, result in zip(restore_ids, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error("Failed to restore media for %s: %s", item_id, result)
 
             now = dt_util.now()
+            restored_ids: list[str] = []
 
             for item_id, item in list(self._active_items.items()):
-                # Normalize scheduled_time if string
-                if "scheduled_time" in item and isinstance(item["scheduled_time"], str):
-                    item["scheduled_time"] = dt_util.parse_datetime(item["scheduled_time"])
-
-                item = self._normalize_item_fields(item)
-                self._active_items[item_id] = item
-
-                descriptor: Dict[str, Any] | None
-                if not isinstance(item.get("sound_media"), dict):
-                    try:
-                        descriptor = await self._prepare_sound_descriptor(
-                            item.get("sound_file"),
-                            is_alarm=item.get("is_alarm", False),
-                        )
-                    except Exception as err:
-                        _LOGGER.error("Failed to normalize media for %s: %s", item_id, err)
-                        descriptor = await self._default_sound_descriptor(item.get("is_alarm", False))
-                else:
-                    descriptor = dict(item["sound_media"])
-
-                media_player_target = item.get("media_player") or self.get_default_media_player()
-                if descriptor is not None:
-                    try:
-                        descriptor = await self._ensure_media_player_media_compatibility(
-                            media_player_target,
-                            descriptor,
-                        )
-                    except ValueError as err:
-                        _LOGGER.warning(
-                            "Media '%s' incompatible with %s during restore: %s. Falling back to default.",
-                            descriptor.get("original_id") or descriptor.get("resolved_url"),
-                            media_player_target,
-                            err,
-                        )
-                        descriptor = await self._default_sound_descriptor(item.get("is_alarm", False))
-
-                    item["sound_media"] = descriptor
-                    playback_id = self._select_media_identifier_for_player(
-                        descriptor,
-                        media_player_target,
-                    )
-                    if playback_id:
-                        item["sound_file"] = playback_id
-                    item = self._normalize_item_fields(item)
-                    self._active_items[item_id] = item
-
+                # Single normalization pass; it also parses stored datetime strings
+                self._normalize_item_fields(item, in_place=True)
                 status = item.get("status", "scheduled")
 
                 if item.get("is_alarm") and isinstance(item.get("scheduled_time"), datetime):
                     self._bump_last_alarm_time(item["scheduled_time"])
 
-                # Restore entity state in HA
-                state_data = dict(item)
-                if "scheduled_time" in state_data and isinstance(state_data["scheduled_time"], datetime):
-                    state_data["scheduled_time"] = state_data["scheduled_time"].isoformat()
-
                 # Mark overall state 'active' if any active items exist, otherwise 'idle'
                 # and include full items lists as attributes.
                 # schedule playback/resume as before per item
                 if status == "active":
-                    self._stop_events[item_id] = asyncio.Event()
-                    task = self.hass.async_create_task(self._start_playback(item_id), name=f"playback_{item_id}")
-                    self._playback_tasks[item_id] = task
+                    runtime = self._item_runtime(item_id)
+                    runtime.stop_event = asyncio.Event()
+                    runtime.playback_task = self.hass.async_create_task(
+                        self._start_playback(item_id), name=f"playback_{item_id}"
+                    )
                 # Schedule future triggers for scheduled items
                 elif status == "scheduled" and item.get("scheduled_time"):
                     sched = item["scheduled_time"]
-                    if isinstance(sched, str):
-                        sched = dt_util.parse_datetime(sched)
-                        item["scheduled_time"] = sched
-
                     if isinstance(sched, datetime):
                         adjusted = self._ensure_future_schedule_time(
                             sched,
@@ -3136,15 +3825,20 @@ class AlarmAndReminderCoordinator:
                         if adjusted is not None:
                             if adjusted != sched:
                                 item["scheduled_time"] = adjusted
-                                self._active_items[item_id] = item
+                                self._put_item(item_id, item)
                                 sched = adjusted
                         self._schedule_trigger(item_id, sched)
 
-                self._write_item_state(item_id)
+                restored_ids.append(item_id)
 
-            # update central dashboard entity
-            self._update_dashboard_state()
-            self._broadcast_state_refresh()
+            # Persist normalization and schedule adjustments made during restore
+            self._schedule_save()
+
+            # Entity and dashboard writes wait until startup finishes (immediately on reload)
+            self.async_cancel_restored_publish()
+            self._unsub_publish_restored = async_at_started(
+                self.hass, partial(self._publish_restored_states, restored_ids)
+            )
 
         except Exception as err:
             _LOGGER.error("Error loading items in coordinator: %s", err, exc_info=True)
@@ -3185,7 +3879,7 @@ class AlarmAndReminderCoordinator:
                 display_name = item_name
 
             repeat_raw = call.data.get("repeat", "once")
-            repeat = repeat_raw.lower() if isinstance(repeat_raw, str) else (repeat_raw or "once")
+            repeat = _cheap_lower(repeat_raw) if isinstance(repeat_raw, str) else (repeat_raw or "once")
             repeat_days_raw = call.data.get("repeat_days", [])
             if repeat_days_raw is None:
                 repeat_days = []
@@ -3194,7 +3888,7 @@ class AlarmAndReminderCoordinator:
             else:
                 repeat_days = [repeat_days_raw]
             repeat_days = [
-                str(day).strip().lower()
+                _cheap_lower(str(day).strip())
                 for day in repeat_days
                 if day is not None and str(day).strip()
             ]
@@ -3241,7 +3935,7 @@ class AlarmAndReminderCoordinator:
                 scheduled_time = datetime.combine(now.date(), time_obj)
 
             # Make scheduled_time timezone-aware in Home Assistant's local timezone
-            scheduled_time = dt_util.as_local(scheduled_time)
+            scheduled_time = _ensure_local(scheduled_time)
 
             adjusted_time = self._ensure_future_schedule_time(
                 scheduled_time,
@@ -3322,18 +4016,15 @@ class AlarmAndReminderCoordinator:
                 item[ATTR_VOLUME] = volume_override
 
             # Save and put into memory
-            normalized = self._normalize_item_fields(item)
-            self._active_items[item_id] = normalized
-            await self.storage.async_save(self._active_items)
+            normalized = self._normalize_item_fields(item, in_place=True)
+            self._put_item(item_id, normalized)
+            self._schedule_save()
 
             # Update central dashboard entity (single switch-like view)
-            self._update_dashboard_state()
-            self._broadcast_state_refresh()
+            self._schedule_refresh()
 
             # Schedule the trigger and keep unsubscribe handle
             scheduled_time = normalized.get("scheduled_time")
-            if isinstance(scheduled_time, str):
-                scheduled_time = dt_util.parse_datetime(scheduled_time)
             if isinstance(scheduled_time, datetime):
                 self._schedule_trigger(item_id, scheduled_time)
                 if normalized.get("is_alarm"):
@@ -3346,7 +4037,7 @@ class AlarmAndReminderCoordinator:
                 )
 
             # Publish individual entity state
-            self._write_item_state(item_id)
+            self._mark_state_dirty(item_id)
 
             _LOGGER.info("Scheduled %s %s for %s", "alarm" if is_alarm else "reminder", item_id, scheduled_time)
 
@@ -3365,18 +4056,17 @@ class AlarmAndReminderCoordinator:
             _LOGGER.debug("Trigger called for unknown item %s", item_id)
             return
 
+        # Mutated in place: every path below writes the item back with a new status.
+        item = self._active_items[item_id]
         try:
-            item = dict(self._active_items[item_id])
-            trigger_time = dt_util.now()
+            triggered_at = dt_util.now().isoformat()
             _LOGGER.debug(
                 "Triggering item %s (%s) at %s",
                 item_id,
                 item.get("name"),
-                trigger_time.isoformat(),
+                triggered_at,
             )
 
-            item["last_triggered"] = trigger_time.isoformat()
-
             # If item is disabled when the trigger fires, mark expired for one-off items
             if not item.get("enabled", True):
                 if item.get("repeat", "once") == "once":
@@ -3384,27 +4074,24 @@ class AlarmAndReminderCoordinator:
                         item_id, reason="Disabled when trigger fired"
                     )
                 else:
+                    item["last_triggered"] = triggered_at
                     item["status"] = "disabled"
-                    self._active_items[item_id] = item
-                    await self.storage.async_save(self._active_items)
-                    self._write_item_state(item_id)
-                    self._update_dashboard_state()
-                    self._broadcast_state_refresh()
+                    self._put_item(item_id, item)
+                    self._schedule_save()
+                    self._mark_state_dirty(item_id)
                 return
 
             # Set status to active and persist
+            item["last_triggered"] = triggered_at
             item["status"] = "active"
-            self._active_items[item_id] = item
-            await self.storage.async_save(self._active_items)
+            self._put_item(item_id, item)
+            self._schedule_save()
 
             # Update central dashboard entity
-            self._write_item_state(item_id)
-            self._update_dashboard_state()
-            self._broadcast_state_refresh()
+            self._mark_state_dirty(item_id)
 
             # Create stop event and start playback in background task
-            stop_event = asyncio.Event()
-            self._stop_events[item_id] = stop_event
+            self._item_runtime(item_id).stop_event = asyncio.Event()
 
             activation_entity = item.get("activation_entity")
             if activation_entity:
@@ -3412,21 +4099,18 @@ class AlarmAndReminderCoordinator:
 
             # Send notification if configured (do not block playback start)
             if item.get("notify_device"):
-                # map tag to item_id so global listener can route actions
-                self._notification_tag_map[item_id] = item_id
                 self.hass.async_create_task(self._send_notification(item_id, item))
 
             # Start playback non-blocking so stop_item can set stop_event
             task = self.hass.async_create_task(self._start_playback(item_id), name=f"playback_{item_id}")
-            self._playback_tasks[item_id] = task
+            self._item_runtime(item_id).playback_task = task
 
         except Exception as err:
             _LOGGER.error("Error triggering item %s: %s", item_id, err, exc_info=True)
             item["status"] = "error"
-            self._active_items[item_id] = item
-            await self.storage.async_save(self._active_items)
-            self._update_dashboard_state()
-            self._broadcast_state_refresh()
+            self._put_item(item_id, item)
+            self._schedule_save()
+            self._schedule_refresh()
 
     async def _activate_associated_entity(self, entity_id: str, item_id: str) -> None:
         """Turn on an associated entity when an item fires."""
@@ -3485,13 +4169,12 @@ class AlarmAndReminderCoordinator:
                 _LOGGER.debug("Playback start: item %s not found", item_id)
                 return
 
-            stop_event = self._stop_events.get(item_id)
-            if not stop_event:
-                stop_event = asyncio.Event()
-                self._stop_events[item_id] = stop_event
+            runtime = self._item_runtime(item_id)
+            if runtime.stop_event is None:
+                runtime.stop_event = asyncio.Event()
 
-            session = _PlaybackSession(self, item_id, stop_event)
-            self._playback_sessions[item_id] = session
+            session = _PlaybackSession(self, item_id, runtime.stop_event)
+            runtime.session = session
             await session.run()
 
         except asyncio.CancelledError:
@@ -3501,16 +4184,18 @@ class AlarmAndReminderCoordinator:
             _LOGGER.error("Error in playback task for %s: %s", item_id, err, exc_info=True)
             if item_id in self._active_items:
                 self._active_items[item_id]["status"] = "error"
-                await self.storage.async_save(self._active_items)
-                self._write_item_state(item_id)
-                self._update_dashboard_state()
-                self._broadcast_state_refresh()
+                self._schedule_save()
+                self._mark_state_dirty(item_id)
         finally:
             _LOGGER.debug("[%s] Entering finally block of _start_playback.", item_id)
-            self._playback_tasks.pop(item_id, None)
-            self._playback_sessions.pop(item_id, None)
-            self._notification_tag_map.pop(item_id, None)
-            stop_event = self._stop_events.pop(item_id, None)
+            stop_event = None
+            runtime = self._runtime.get(item_id)
+            if runtime is not None:
+                stop_event = runtime.stop_event
+                runtime.playback_task = None
+                runtime.session = None
+                runtime.stop_event = None
+                self._prune_runtime(item_id, runtime)
             if item_id in self._active_items:
                 item = self._active_items[item_id]
                 if item.get("status") == "active" and (stop_event is None or stop_event.is_set()):
@@ -3526,20 +4211,12 @@ class AlarmAndReminderCoordinator:
                     item["status"] = "stopped"
                     item["last_stopped"] = now_dt.isoformat()
 
-                    if isinstance(item.get("scheduled_time"), str):
-                        parsed_sched = dt_util.parse_datetime(item.get("scheduled_time"))
-                        if parsed_sched is not None:
-                            item["scheduled_time"] = parsed_sched
-
+                    # Stored items are normalized, so both times are datetimes or None
                     next_time = None
-                    repeat_value = (item.get("repeat", "once") or "once").lower()
+                    repeat_value = _cheap_lower(item.get("repeat", "once") or "once")
                     canonical_time = item.get("scheduled_time_canonical")
-                    if isinstance(canonical_time, str):
-                        parsed_canonical = dt_util.parse_datetime(canonical_time)
-                        if parsed_canonical is not None:
-                            canonical_time = parsed_canonical
                     if isinstance(canonical_time, datetime):
-                        canonical_time = dt_util.as_local(canonical_time)
+                        canonical_time = _ensure_local(canonical_time)
                     elif isinstance(item.get("scheduled_time"), datetime):
                         canonical_time = item.get("scheduled_time")
                     else:
@@ -3563,22 +4240,18 @@ class AlarmAndReminderCoordinator:
                             item["scheduled_time_canonical"] = next_time
 
                     normalized = self._normalize_item_fields(item)
-                    self._active_items[item_id] = normalized
-                    await self.storage.async_save(self._active_items)
+                    self._put_item(item_id, normalized)
+                    self._schedule_save()
 
                     if next_time is not None:
                         sched_dt = normalized.get("scheduled_time")
-                        if isinstance(sched_dt, str):
-                            sched_dt = dt_util.parse_datetime(sched_dt)
                         if isinstance(sched_dt, datetime):
                             self._schedule_trigger(item_id, sched_dt)
                             if normalized.get("is_alarm"):
                                 self._bump_last_alarm_time(sched_dt)
                             _LOGGER.debug("Rescheduled repeating item %s for %s", item_id, sched_dt.isoformat())
 
-                    self._write_item_state(item_id)
-                    self._update_dashboard_state()
-                    self._broadcast_state_refresh()
+                    self._mark_state_dirty(item_id)
 
     async def _send_notification(self, item_id: str, item: dict) -> None:
         """Send notification with action buttons."""
@@ -3587,15 +4260,7 @@ class AlarmAndReminderCoordinator:
             if not device_id:
                 return
 
-            # Accept either "mobile_app_xxx" or "notify.mobile_app_xxx" or just device id
-            # Normalize to notify service target (service = mobile_app_xxx)
-            if device_id.startswith("notify."):
-                service_target = device_id.split(".", 1)[1]
-            elif device_id.startswith("mobile_app_"):
-                service_target = device_id
-            else:
-                # user provided raw id (e.g. mobile_app_sm_a528b) or 'sm_a528b' - assume mobile_app_ prefix if missing 'mobile_app_'
-                service_target = device_id if device_id.startswith("mobile_app_") else f"mobile_app_{device_id}"
+            service_target = _notify_service_target(device_id)
 
             message = item.get("message") or f"It's {dt_util.now().strftime('%I:%M %p')}"
             payload = {
@@ -3613,6 +4278,8 @@ class AlarmAndReminderCoordinator:
             _LOGGER.debug("Notify %s -> %s", service_target, payload)
             await self.hass.services.async_call("notify", service_target, payload, blocking=True)
 
+        except asyncio.CancelledError:
+            raise
         except Exception as err:
             _LOGGER.error("Error sending notification for item %s: %s", item_id, err, exc_info=True)
 
@@ -3625,26 +4292,37 @@ class AlarmAndReminderCoordinator:
             if not tag:
                 return
 
-            # Map tag to item id (we stored item_id as tag earlier)
-            item_id = tag if tag in self._active_items else self._notification_tag_map.get(tag)
-            if not item_id:
+            # Notifications are tagged with the item id, so the tag resolves directly
+            item_id = tag
+            item = self._active_items.get(item_id)
+            if item is None:
                 _LOGGER.debug("Notification action for unknown tag: %s", tag)
                 return
 
             _LOGGER.debug("Notification action '%s' for item %s", action, item_id)
             if action == "stop":
-                self.hass.async_create_task(self.stop_item(item_id, self._active_items[item_id]["is_alarm"]))
+                self.hass.async_create_task(self.stop_item(item_id, item["is_alarm"]))
             elif action == "snooze":
                 minutes = self.get_default_snooze_minutes()
                 self.hass.async_create_task(
-                    self.snooze_item(item_id, minutes, self._active_items[item_id]["is_alarm"])
+                    self.snooze_item(item_id, minutes, item["is_alarm"])
                 )
 
         except Exception as err:
             _LOGGER.error("Error handling mobile notification action: %s", err, exc_info=True)
 
-    async def stop_item(self, item_id: str, is_alarm: bool, *, reason: str = "stopped") -> None:
-        """Stop an active or scheduled item."""
+    async def stop_item(
+        self,
+        item_id: str,
+        is_alarm: bool,
+        *,
+        reason: str = "stopped",
+        defer_persist: bool = False,
+    ) -> None:
+        """Stop an active or scheduled item.
+
+        With defer_persist the caller is responsible for saving storage afterwards.
+        """
         
         _LOGGER.debug("stop_item called on coordinator: %s", id(self))
 
@@ -3658,7 +4336,7 @@ class AlarmAndReminderCoordinator:
                 "Stop request for %s (resolved=%s). Current active items: %s",
                 raw_id,
                 resolved_id,
-                {k: {'name': v.get('name'), 'status': v.get('status')} for k, v in self._active_items.items()},
+                _LazyStr(self._summarize_active_items),
             )
 
             # Try to find the item in active items or storage
@@ -3672,16 +4350,15 @@ class AlarmAndReminderCoordinator:
                 if stored and isinstance(stored, dict):
                     if item_id in stored:
                         candidate_id = item_id
-                    else:
-                        lowered = item_id.casefold() if isinstance(item_id, str) else None
-                        if lowered is not None:
-                            for key in stored.keys():
-                                if isinstance(key, str) and key.casefold() == lowered:
-                                    candidate_id = key
-                                    break
+                    elif isinstance(item_id, str):
+                        # Reversed so the first stored key wins, as with a forward scan
+                        casefold_keys = {
+                            key.casefold(): key for key in reversed(stored) if isinstance(key, str)
+                        }
+                        candidate_id = casefold_keys.get(item_id.casefold())
                 if candidate_id is not None:
                     item = self._normalize_item_fields(stored[candidate_id])
-                    self._active_items[candidate_id] = item
+                    self._put_item(candidate_id, item)
                     item_id = candidate_id
                     _LOGGER.debug("Restored item %s from storage", item_id)
 
@@ -3699,20 +4376,32 @@ class AlarmAndReminderCoordinator:
 
             self._cancel_scheduled_trigger(item_id)
 
+            stop_event = playback_task = session = None
+            runtime = self._runtime.get(item_id)
+            if runtime is not None:
+                stop_event, runtime.stop_event = runtime.stop_event, None
+                playback_task, runtime.playback_task = runtime.playback_task, None
+
             # Set stop event if exists (playback loop checks this)
-            stop_event = self._stop_events.pop(item_id, None)
             if stop_event:
                 stop_event.set()
 
-            playback_task = self._playback_tasks.pop(item_id, None)
             if playback_task:
                 item["_manual_stop_pending"] = True
                 playback_task.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
                     await playback_task
                 item.pop("_manual_stop_pending", None)
-
-            session = self._playback_sessions.pop(item_id, None)
+                # The suppress above is for the playback task; don't eat our own cancellation
+                current = asyncio.current_task()
+                if current is not None and current.cancelling():
+                    raise asyncio.CancelledError
+
+            # A cancelled playback task clears its own session in its cleanup
+            runtime = self._runtime.get(item_id)
+            if runtime is not None:
+                session, runtime.session = runtime.session, None
+                self._prune_runtime(item_id, runtime)
             if session:
                 await session.stop(reason=reason)
             try:
@@ -3735,21 +4424,12 @@ class AlarmAndReminderCoordinator:
             now_dt = dt_util.now()
 
             scheduled_time = item.get("scheduled_time")
-            if isinstance(scheduled_time, str):
-                parsed_sched = dt_util.parse_datetime(scheduled_time)
-                if parsed_sched is not None:
-                    scheduled_time = parsed_sched
-                    item["scheduled_time"] = parsed_sched
-            repeat_value = (item.get("repeat", "once") or "once").lower()
+            repeat_value = _cheap_lower(item.get("repeat", "once") or "once")
             repeat_days = item.get("repeat_days", []) or []
 
             canonical_time = item.get("scheduled_time_canonical")
-            if isinstance(canonical_time, str):
-                parsed_canonical = dt_util.parse_datetime(canonical_time)
-                if parsed_canonical is not None:
-                    canonical_time = parsed_canonical
             if isinstance(canonical_time, datetime):
-                canonical_time = dt_util.as_local(canonical_time)
+                canonical_time = _ensure_local(canonical_time)
             elif isinstance(scheduled_time, datetime):
                 canonical_time = scheduled_time
             else:
@@ -3759,11 +4439,11 @@ class AlarmAndReminderCoordinator:
             item["status"] = "stopped"
             item["last_stopped"] = now_dt.isoformat()
 
-            if repeat_value == "once" and reason not in {"snoozed"}:
+            if repeat_value == "once" and reason != "snoozed":
                 expire_reason = "Stopped one-off item after playback" if was_active else "Cancelled one-off item"
-                if reason and reason not in {"stopped", "snoozed"}:
+                if reason and reason not in _ROUTINE_STOP_REASONS:
                     expire_reason = f"{expire_reason} ({reason})"
-                self._active_items[item_id] = item
+                self._put_item(item_id, item)
                 await self._mark_item_expired(item_id, reason=expire_reason)
                 return
 
@@ -3773,7 +4453,7 @@ class AlarmAndReminderCoordinator:
                 repeat_value != "once"
                 and not was_active
                 and isinstance(canonical_time, datetime)
-                and reason not in {"deleted"}
+                and reason != "deleted"
             ):
                 next_time = self._ensure_future_schedule_time(
                     canonical_time,
@@ -3798,7 +4478,7 @@ class AlarmAndReminderCoordinator:
                     and item.get("enabled", True)
                     and isinstance(canonical_time, datetime)
                     and repeat_value != "once"
-                    and reason not in {"snoozed", "deleted"}
+                    and reason not in _NO_RESCHEDULE_REASONS
                 )
 
                 if should_reschedule:
@@ -3815,13 +4495,12 @@ class AlarmAndReminderCoordinator:
                         item["scheduled_time_canonical"] = next_time
 
             normalized = self._normalize_item_fields(item)
-            self._active_items[item_id] = normalized
-            await self.storage.async_save(self._active_items)
+            self._put_item(item_id, normalized)
+            if not defer_persist:
+                await self.storage.async_save_item(item_id, normalized)
 
             if next_time is not None:
                 sched_dt = normalized.get("scheduled_time")
-                if isinstance(sched_dt, str):
-                    sched_dt = dt_util.parse_datetime(sched_dt)
                 if isinstance(sched_dt, datetime):
                     self._schedule_trigger(item_id, sched_dt)
                     if normalized.get("is_alarm"):
@@ -3829,11 +4508,11 @@ class AlarmAndReminderCoordinator:
                     _LOGGER.debug("Rescheduled repeating item %s for %s", item_id, sched_dt.isoformat())
 
             # Update central dashboard entity
-            self._write_item_state(item_id)
-            self._update_dashboard_state()
-            self._broadcast_state_refresh()
+            self._mark_state_dirty(item_id)
             _LOGGER.info("Successfully stopped %s: %s", "alarm" if is_alarm else "reminder", item_id)
 
+        except asyncio.CancelledError:
+            raise
         except Exception as err:
             _LOGGER.error("Error stopping item %s: %s", item_id, err, exc_info=True)
 
@@ -3865,29 +4544,18 @@ class AlarmAndReminderCoordinator:
 
             # Ensure canonical schedule is preserved before snoozing
             current_sched = item.get("scheduled_time")
-            if isinstance(current_sched, str):
-                parsed_sched = dt_util.parse_datetime(current_sched)
-                if parsed_sched is not None:
-                    current_sched = parsed_sched
-                    item["scheduled_time"] = parsed_sched
             canonical = item.get("scheduled_time_canonical")
-            if isinstance(canonical, str):
-                parsed_canonical = dt_util.parse_datetime(canonical)
-                if parsed_canonical is not None:
-                    canonical = parsed_canonical
             if not isinstance(canonical, datetime):
                 canonical = current_sched if isinstance(current_sched, datetime) else None
             if isinstance(canonical, datetime):
-                canonical = dt_util.as_local(canonical)
+                canonical = _ensure_local(canonical)
             item["scheduled_time_canonical"] = canonical
-            self._active_items[item_id] = item
+            self._put_item(item_id, item)
 
             # Step 1: Stop the item using stop_item method
             await self.stop_item(item_id, is_alarm, reason="snoozed")
-            
-            # Wait for stop to complete and verify status
-            await asyncio.sleep(1)  # Give time for stop to complete
-            
+
+            # stop_item returns only after the playback task and session have wound down
             # Verify item is stopped
             if item_id in self._active_items and self._active_items[item_id]["status"] != "stopped":
                 _LOGGER.error("Failed to stop item %s before snoozing", item_id)
@@ -3912,21 +4580,17 @@ class AlarmAndReminderCoordinator:
             
             # Step 4: Save to storage
             normalized = self._normalize_item_fields(item)
-            self._active_items[item_id] = normalized
-            await self.storage.async_save(self._active_items)
+            self._put_item(item_id, normalized)
+            await self.storage.async_save_item(item_id, normalized)
             
-            # Step 5: Update central dashboard
-            self._update_dashboard_state()
+            # Step 5: Update central dashboard and entity state
+            self._mark_state_dirty(item_id)
 
             # Step 6: Schedule new trigger
             self._schedule_trigger(item_id, new_time)
             if is_alarm:
                 self._bump_last_alarm_time(new_time)
 
-            # Sync entity state
-            self._write_item_state(item_id)
-
-            self._broadcast_state_refresh()
             _LOGGER.info(
                 "Successfully snoozed %s %s for %d minutes. Will ring at %s",
                 "alarm" if is_alarm else "reminder",
@@ -3935,6 +4599,8 @@ class AlarmAndReminderCoordinator:
                 new_time.strftime("%H:%M:%S")
             )
 
+        except asyncio.CancelledError:
+            raise
         except Exception as err:
             _LOGGER.error("Error snoozing item %s: %s", item_id, err, exc_info=True)
 
@@ -3945,12 +4611,14 @@ class AlarmAndReminderCoordinator:
             for item_id, item in list(self._active_items.items()):
                 if is_alarm is None or item["is_alarm"] == is_alarm:
                     if item.get("status") in ["active", "scheduled"]:
-                        await self.stop_item(item_id, item["is_alarm"])
+                        await self.stop_item(item_id, item["is_alarm"], defer_persist=True)
                         stopped_count += 1
 
             if stopped_count == 0:
                 _LOGGER.info("No active items to stop")
             else:
+                # One write for the whole batch; it also flushes any pending delayed save
+                await self.storage.async_save(self._active_items)
                 _LOGGER.info(
                     "Successfully stopped %d %s",
                     stopped_count,
@@ -3959,6 +4627,8 @@ class AlarmAndReminderCoordinator:
                     else "reminders" if is_alarm is not None else "items",
                 )
 
+        except asyncio.CancelledError:
+            raise
         except Exception as err:
             _LOGGER.error("Error stopping all items: %s", err, exc_info=True)
 
@@ -3967,9 +4637,7 @@ class AlarmAndReminderCoordinator:
         try:
             _LOGGER.debug("Starting edit request for %s", item_id)
             _LOGGER.debug("Changes requested: %s", changes)
-            _LOGGER.debug("Current active items: %s", 
-                         {k: {'name': v.get('name'), 'status': v.get('status')} 
-                          for k, v in self._active_items.items()})
+            _LOGGER.debug("Current active items: %s", _LazyStr(self._summarize_active_items))
 
             # Remove domain prefix if present
             item_id = self._strip_domain(item_id)
@@ -3979,13 +4647,10 @@ class AlarmAndReminderCoordinator:
             if item_id in self._active_items:
                 found_id = item_id
             else:
-                # Try by name
+                # Try by name, then by case-insensitive id
                 name_to_find = item_id.replace("_", " ").lower()
-                for aid, item in self._active_items.items():
-                    if (item.get('name', '').lower() == name_to_find or 
-                        aid.lower() == name_to_find):
-                        found_id = aid
-                        break
+                named = self._item_ids_named(name_to_find)
+                found_id = named[0] if named else self._resolve_active_item_id(name_to_find)
 
             if not found_id:
                 _LOGGER.error("Item %s not found in active items: %s", 
@@ -3996,6 +4661,9 @@ class AlarmAndReminderCoordinator:
 
             existing_item = self._active_items[found_id]
             original_status = existing_item.get("status", "scheduled")
+            # One instant for every "now" comparison in this edit
+            now_dt = dt_util.now()
+            # Edit a copy so a rejected change (e.g. duplicate name) leaves the live item intact
             item = dict(existing_item)
             changes = dict(changes)
             schedule_changed = False
@@ -4011,11 +4679,6 @@ class AlarmAndReminderCoordinator:
 
             # Process changes
             current_scheduled = item.get("scheduled_time")
-            if isinstance(current_scheduled, str):
-                parsed_current = dt_util.parse_datetime(current_scheduled)
-                if parsed_current is not None:
-                    current_scheduled = parsed_current
-                    item["scheduled_time"] = parsed_current
 
             if "time" in changes or "date" in changes:
                 time_input = changes.get("time")
@@ -4023,7 +4686,7 @@ class AlarmAndReminderCoordinator:
                     time_input = (
                         current_scheduled.time()
                         if isinstance(current_scheduled, datetime)
-                        else dt_util.now().time()
+                        else now_dt.time()
                     )
                 elif isinstance(time_input, str):
                     parsed_time = dt_util.parse_time(time_input)
@@ -4036,7 +4699,7 @@ class AlarmAndReminderCoordinator:
                     date_input = (
                         current_scheduled.date()
                         if isinstance(current_scheduled, datetime)
-                        else dt_util.now().date()
+                        else now_dt.date()
                     )
                 elif isinstance(date_input, str):
                     parsed_date = dt_util.parse_date(date_input)
@@ -4045,9 +4708,9 @@ class AlarmAndReminderCoordinator:
                     date_input = parsed_date
 
                 new_time = datetime.combine(date_input, time_input)
-                new_time = dt_util.as_local(new_time)
+                new_time = _ensure_local(new_time)
 
-                if new_time < dt_util.now() and "date" not in changes:
+                if new_time < now_dt and "date" not in changes:
                     new_time = new_time + timedelta(days=1)
 
                 item["scheduled_time"] = new_time
@@ -4098,8 +4761,8 @@ class AlarmAndReminderCoordinator:
                         self._get_next_available_id("alarm") if is_alarm else self._get_next_available_id("reminder")
                     )
                 if not is_alarm:
-                    for other_id, other_item in self._active_items.items():
-                        if other_id != found_id and other_item.get("name") == slug:
+                    for other_id in self._item_ids_named(slug.lower()):
+                        if other_id != found_id and self._active_items[other_id].get("name") == slug:
                             raise ValueError(f"Reminder name already exists: {incoming_name}")
                 item["name"] = slug
             changes.pop("name", None)
@@ -4120,7 +4783,7 @@ class AlarmAndReminderCoordinator:
                 elif not isinstance(rd, list):
                     rd = list(rd)
                 item["repeat_days"] = [
-                    str(day).strip().lower()
+                    _cheap_lower(str(day).strip())
                     for day in rd
                     if day is not None and str(day).strip()
                 ]
@@ -4162,7 +4825,7 @@ class AlarmAndReminderCoordinator:
                     item.get("scheduled_time"),
                     repeat=item.get("repeat", "once"),
                     repeat_days=item.get("repeat_days", []),
-                    reference=dt_util.now(),
+                    reference=now_dt,
                 )
                 if adjusted_time is not None:
                     item["scheduled_time"] = adjusted_time
@@ -4173,25 +4836,25 @@ class AlarmAndReminderCoordinator:
             ):
                 item["scheduled_time_canonical"] = item["scheduled_time"]
 
-            # Store updated item
-            normalized = self._normalize_item_fields(item)
+            # Store updated item; item is already our private copy
+            normalized = self._normalize_item_fields(item, in_place=True)
             new_enabled = normalized.get("enabled", True)
 
             if new_enabled:
                 normalized["status"] = "scheduled"
             else:
-                if original_status in ("scheduled", "active", "expired"):
+                if original_status in _DISABLEABLE_STATUSES:
                     normalized["status"] = "disabled"
                 else:
                     normalized["status"] = original_status or "disabled"
 
-            self._active_items[found_id] = normalized
+            self._put_item(found_id, normalized)
 
             # Edited items that remain disabled should not keep any scheduled triggers
             self._cancel_scheduled_trigger(found_id)
 
             # Save to storage
-            await self.storage.async_save(self._active_items)
+            await self.storage.async_save_item(found_id, normalized)
 
             # Update entity state
             if new_enabled and normalized.get("scheduled_time"):
@@ -4199,13 +4862,8 @@ class AlarmAndReminderCoordinator:
                 if normalized.get("is_alarm"):
                     self._bump_last_alarm_time(normalized.get("scheduled_time"))
 
-            self._write_item_state(found_id)
-
-            # Refresh dashboard summary
-            self._update_dashboard_state()
-
-            # Force update of sensors
-            self._broadcast_state_refresh()
+            # Refresh entity, dashboard summary and sensors
+            self._mark_state_dirty(found_id)
 
             _LOGGER.info(
                 "Successfully edited %s: %s", 
@@ -4216,12 +4874,17 @@ class AlarmAndReminderCoordinator:
         except ValueError as err:
             _LOGGER.error("Error editing item %s: %s", item_id, err)
             raise HomeAssistantError(str(err)) from err
+        except asyncio.CancelledError:
+            raise
         except Exception as err:
             _LOGGER.error("Error editing item %s: %s", item_id, err, exc_info=True)
             raise HomeAssistantError("Failed to edit item") from err
 
-    async def delete_item(self, item_id: str, is_alarm: bool) -> None:
-        """Delete a specific item."""
+    async def delete_item(self, item_id: str, is_alarm: bool, *, defer_persist: bool = False) -> None:
+        """Delete a specific item.
+
+        With defer_persist the caller is responsible for saving storage afterwards.
+        """
         try:
             resolved_item_id = self._resolve_active_item_id(item_id)
             if not resolved_item_id:
@@ -4240,13 +4903,14 @@ class AlarmAndReminderCoordinator:
                 )
                 return
 
-            await self.stop_item(item_id, is_alarm, reason="deleted")
+            await self.stop_item(item_id, is_alarm, reason="deleted", defer_persist=defer_persist)
 
             entity_id = self._entity_id_for_item(item_id, item)
 
             # Remove from storage and active items
-            await self.storage.async_delete_item(item_id)
-            self._active_items.pop(item_id, None)
+            if not defer_persist:
+                await self.storage.async_delete_item(item_id)
+            self._pop_item(item_id)
 
             # Remove entity
             self.hass.states.async_remove(entity_id)
@@ -4259,8 +4923,8 @@ class AlarmAndReminderCoordinator:
 
             self._fire_state_event(entity_id, action="removed")
 
-            # Refresh dashboard view after removal
-            self._update_dashboard_state()
+            # Refresh dashboard view after removal; a bulk delete shares one refresh
+            self._schedule_refresh()
 
             _LOGGER.info(
                 "Successfully deleted %s: %s",
@@ -4282,7 +4946,7 @@ class AlarmAndReminderCoordinator:
             deleted_count = 0
             for item_id, is_alarm_item in targets:
                 try:
-                    await self.delete_item(item_id, is_alarm_item)
+                    await self.delete_item(item_id, is_alarm_item, defer_persist=True)
                     deleted_count += 1
                 except Exception as err:
                     _LOGGER.error(
@@ -4293,7 +4957,8 @@ class AlarmAndReminderCoordinator:
                     )
 
             if deleted_count > 0:
-                self._update_dashboard_state()
+                # One write for the whole batch instead of one per deleted item
+                await self.storage.async_save(self._active_items)
                 _LOGGER.info(
                     "Successfully deleted %d %s",
                     deleted_count,
@@ -4318,7 +4983,7 @@ class AlarmAndReminderCoordinator:
                 # Try to find item in storage
                 stored_items = await self.storage.async_load()
                 if item_id in stored_items:
-                    self._active_items[item_id] = self._normalize_item_fields(stored_items[item_id])
+                    self._put_item(item_id, self._normalize_item_fields(stored_items[item_id]))
                     _LOGGER.debug("Restored item %s from storage", item_id)
                 else:
                     _LOGGER.error("Item %s not found in storage or active items", item_id)
@@ -4327,11 +4992,6 @@ class AlarmAndReminderCoordinator:
             item = self._active_items[item_id]
             original_status = item.get("status", "scheduled")
 
-            if isinstance(item.get("scheduled_time"), str):
-                parsed_sched = dt_util.parse_datetime(item.get("scheduled_time"))
-                if parsed_sched is not None:
-                    item["scheduled_time"] = parsed_sched
-
             schedule_changed = False
 
             # Verify item type matches
@@ -4361,7 +5021,7 @@ class AlarmAndReminderCoordinator:
                         raise ValueError(f"Invalid date format: {date_input}")
                     date_input = parsed_date
                 new_time = datetime.combine(date_input, time_input)
-                new_time = dt_util.as_local(new_time)
+                new_time = _ensure_local(new_time)
                 
                 # Validate future time
                 if new_time < now:
@@ -4409,8 +5069,8 @@ class AlarmAndReminderCoordinator:
                         self._get_next_available_id("alarm") if is_alarm else self._get_next_available_id("reminder")
                     )
                 if not is_alarm:
-                    for other_id, other_item in self._active_items.items():
-                        if other_id != item_id and other_item.get("name") == slug:
+                    for other_id in self._item_ids_named(slug.lower()):
+                        if other_id != item_id and self._active_items[other_id].get("name") == slug:
                             raise ValueError(f"Reminder name already exists: {incoming_name}")
                 item["name"] = slug
             changes.pop("name", None)
@@ -4431,7 +5091,7 @@ class AlarmAndReminderCoordinator:
                 elif not isinstance(rd, list):
                     rd = list(rd)
                 item["repeat_days"] = [
-                    str(day).strip().lower()
+                    _cheap_lower(str(day).strip())
                     for day in rd
                     if day is not None and str(day).strip()
                 ]
@@ -4457,7 +5117,7 @@ class AlarmAndReminderCoordinator:
                     item.get("scheduled_time"),
                     repeat=item.get("repeat", "once"),
                     repeat_days=item.get("repeat_days", []),
-                    reference=dt_util.now(),
+                    reference=now,
                 )
                 if adjusted_time is not None:
                     item["scheduled_time"] = adjusted_time
@@ -4468,7 +5128,7 @@ class AlarmAndReminderCoordinator:
             if new_enabled:
                 item["status"] = "scheduled"
             else:
-                if original_status in ("scheduled", "active", "expired"):
+                if original_status in _DISABLEABLE_STATUSES:
                     item["status"] = "disabled"
                 else:
                     item["status"] = original_status or "disabled"
@@ -4476,8 +5136,9 @@ class AlarmAndReminderCoordinator:
                 item["last_rescheduled_from"] = item["last_stopped"]
             
             # Create stop event if needed
-            if item_id not in self._stop_events:
-                self._stop_events[item_id] = asyncio.Event()
+            runtime = self._item_runtime(item_id)
+            if runtime.stop_event is None:
+                runtime.stop_event = asyncio.Event()
             
             # Save changes
             if isinstance(item.get("scheduled_time"), datetime) and (
@@ -4485,17 +5146,15 @@ class AlarmAndReminderCoordinator:
             ):
                 item["scheduled_time_canonical"] = item["scheduled_time"]
             normalized = self._normalize_item_fields(item)
-            self._active_items[item_id] = normalized
-            await self.storage.async_save(self._active_items)
+            self._put_item(item_id, normalized)
+            await self.storage.async_save_item(item_id, normalized)
 
             scheduled_time = normalized.get("scheduled_time")
-            if isinstance(scheduled_time, str):
-                scheduled_time = dt_util.parse_datetime(scheduled_time)
             schedule_now = new_enabled and isinstance(scheduled_time, datetime)
             if schedule_now:
                 if (
                     normalized.get("repeat", "once") == "once"
-                    and scheduled_time <= dt_util.now()
+                    and scheduled_time <= now
                 ):
                     await self._mark_item_expired(
                         item_id, reason="Rescheduled time already passed"
@@ -4503,7 +5162,7 @@ class AlarmAndReminderCoordinator:
                     return
             
             # Update entity state
-            self._write_item_state(item_id)
+            self._mark_state_dirty(item_id)
 
             # Schedule new trigger with task name if enabled
             if schedule_now:
@@ -4518,9 +5177,6 @@ class AlarmAndReminderCoordinator:
                 scheduled_time.strftime("%Y-%m-%d %H:%M:%S") if schedule_now else normalized.get("scheduled_time")
             )
 
-            self._update_dashboard_state()
-            self._broadcast_state_refresh()
-
         except ValueError as err:
             _LOGGER.error("Error rescheduling item %s: %s", item_id, err)
             raise HomeAssistantError(str(err)) from err
@@ -4528,6 +5184,24 @@ class AlarmAndReminderCoordinator:
             _LOGGER.error("Error rescheduling item %s: %s", item_id, err, exc_info=True)
             raise HomeAssistantError("Failed to reschedule item") from err
 
+    def _dashboard_summary(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the dashboard fields of an item without serializing the whole item."""
+        shared = self._serialize_shared_fields(item)
+        return {
+            "name": item.get("name"),
+            "status": item.get("status"),
+            "scheduled_time": shared["scheduled_time"],
+            "message": item.get("message"),
+            "is_alarm": bool(item.get("is_alarm")),
+            "sound_file": item.get("sound_file"),
+            "media_player": shared["media_player"],
+            "repeat": item.get("repeat"),
+            "repeat_days": shared["repeat_days"],
+            "notify_device": item.get("notify_device"),
+            "announce_time": shared["announce_time"],
+            "activation_entity": shared["activation_entity"],
+        }
+
     def _update_dashboard_state(self) -> None:
         """Update the dashboard sensor with full lists of alarms and reminders."""
         try:
@@ -4535,21 +5209,7 @@ class AlarmAndReminderCoordinator:
             reminders = {}
             overall_state = "idle"
             for iid, item in self._active_items.items():
-                serialized = self._serialize_item_state(item)
-                summary = {
-                    "name": serialized.get("name"),
-                    "status": serialized.get("status"),
-                    "scheduled_time": serialized.get("scheduled_time"),
-                    "message": serialized.get("message"),
-                    "is_alarm": bool(serialized.get("is_alarm")),
-                    "sound_file": serialized.get("sound_file"),
-                    "media_player": serialized.get("media_player"),
-                    "repeat": serialized.get("repeat"),
-                    "repeat_days": serialized.get("repeat_days", []),
-                    "notify_device": serialized.get("notify_device"),
-                    "announce_time": serialized.get("announce_time", True),
-                    "activation_entity": serialized.get("activation_entity"),
-                }
+                summary = self._dashboard_summary(item)
                 if item.get("status") == "active":
                     overall_state = "active"
                 if item.get("is_alarm"):
@@ -69,19 +69,7 @@ def _parse_slot_datetime(value: str) -> datetime | None:
 
 def _find_active_item_id(coordinator, *, is_alarm: bool) -> str | None:
     """Locate the first active alarm or reminder in the coordinator."""
-    active_items = getattr(coordinator, "_active_items", {})
-    if not isinstance(active_items, dict):
-        return None
-
-    for item_id, item in active_items.items():
-        if not isinstance(item, dict):
-            continue
-        if item.get("is_alarm") != is_alarm:
-            continue
-        if item.get("status") == "active":
-            return item_id
-
-    return None
+    return coordinator.get_first_active(is_alarm)
 
 async def async_setup_intents(hass: HomeAssistant) -> None:
     """Set up the HA Alarm Clock intents."""
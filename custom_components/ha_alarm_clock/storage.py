@@ -1,11 +1,14 @@
 """Storage handling for HA Alarm Clock."""
 from __future__ import annotations
-from typing import Dict, Any, MutableMapping, Optional, cast
+from typing import Dict, Any, Callable, MutableMapping, Optional, cast
+from datetime import datetime
+import hashlib
 import logging
 import asyncio
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.loader import bind_hass
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,8 +28,11 @@ class AlarmReminderStorage:
         # keep a single flattened in-memory mapping for runtime convenience
         # but persist as separated buckets "Alarms"/"Reminders" per request
         self._items: MutableMapping[str, Dict[str, Any]] = {}
-        self._save_handle: Optional[asyncio.TimerHandle] = None
         self._lock = asyncio.Lock()
+        # Digest of the data last written by async_save; None when unknown
+        self._saved_digest: Optional[bytes] = None
+        # items_func of the queued delayed save, if one is pending
+        self._pending_items_func: Optional[Callable[[], MutableMapping[str, Dict[str, Any]]]] = None
 
     async def async_load(self) -> Dict[str, Dict[str, Any]]:
         """Load all items from storage and return flattened mapping item_id -> item dict.
@@ -74,16 +80,29 @@ class AlarmReminderStorage:
     @callback
     def async_schedule_save(self) -> None:
         """Schedule save with debounce (SAVE_DELAY sec)."""
-        # cancel existing handle if present
-        if self._save_handle:
-            try:
-                self._save_handle.cancel()
-            except Exception:
-                pass
-            self._save_handle = None
+        self.async_delay_save(lambda: self._items)
 
-        loop = self.hass.loop
-        self._save_handle = loop.call_later(SAVE_DELAY, lambda: self.hass.async_create_task(self.async_save()))
+    @callback
+    def async_delay_save(
+        self,
+        items_func: Callable[[], MutableMapping[str, Dict[str, Any]]],
+        delay: float = SAVE_DELAY,
+    ) -> None:
+        """Debounce a save; items_func is read once the delay expires.
+
+        Repeated calls within the delay collapse into a single write, and the
+        Store flushes any pending write when Home Assistant shuts down.
+        """
+        # The delayed write lands outside async_save, so the last digest is no longer reliable
+        self._saved_digest = None
+        self._pending_items_func = items_func
+        self._store.async_delay_save(self._delayed_payload, delay)
+
+    def _delayed_payload(self) -> Dict[str, Any]:
+        """data_func for delayed writes: snapshot whatever items are current now."""
+        items_func = self._pending_items_func
+        self._pending_items_func = None
+        return self._build_payload(items_func() if items_func is not None else self._items)
 
     async def async_save(self, items: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
         """Persist flattened items mapping to storage using grouped structure.
@@ -97,25 +116,64 @@ class AlarmReminderStorage:
         except Exception as err:
             _LOGGER.exception("Error saving to storage: %s", err)
 
+    async def async_save_item(self, item_id: str, item: Dict[str, Any]) -> None:
+        """Persist a change to one item, reusing the stored copies of all others.
+
+        A queued delayed save may hold changes to other items; Store.async_save
+        would cancel it, so in that case the full snapshot is written instead.
+        """
+        try:
+            async with self._lock:
+                items_func = self._pending_items_func
+                if items_func is not None:
+                    await self._save_locked(items_func())
+                    return
+                self._items[item_id] = self._serialize_item(item)
+                await self._write_locked(self._payload_from_stored())
+        except Exception as err:
+            _LOGGER.exception("Error saving %s to storage: %s", item_id, err)
+
     async def _save_locked(self, items: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
         """Persist items to storage; caller must hold _lock."""
         if items is None:
             items = dict(self._items)
 
+        await self._write_locked(self._build_payload(items))
+
+    async def _write_locked(self, payload: Dict[str, Any]) -> None:
+        """Write payload unless it matches the last write; caller must hold _lock."""
+        digest = hashlib.blake2b(json_bytes(payload["data"]), digest_size=16).digest()
+        if digest == self._saved_digest:
+            _LOGGER.debug("AlarmReminderStorage unchanged; skipping write")
+            return
+        # Store.async_save supersedes (cancels) any queued delayed write
+        self._pending_items_func = None
+        await self._store.async_save(payload)
+        self._saved_digest = digest
+
+    @staticmethod
+    def _serialize_item(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a storage copy of an item with datetimes as ISO strings."""
+        # Copy so the executor-side JSON encode never sees live dicts
+        stored = dict(data)
+        sched = stored.get("scheduled_time")
+        if isinstance(sched, datetime):
+            stored["scheduled_time"] = sched.isoformat()
+        canonical = stored.get("scheduled_time_canonical")
+        if isinstance(canonical, datetime):
+            stored["scheduled_time_canonical"] = canonical.isoformat()
+        return stored
+
+    def _build_payload(self, items: MutableMapping[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Serialize every item into _items and return the grouped payload."""
+        self._items = {item_id: self._serialize_item(data) for item_id, data in items.items()}
+        return self._payload_from_stored()
+
+    def _payload_from_stored(self) -> Dict[str, Any]:
+        """Group the stored item copies into the Alarms/Reminders layout."""
         alarms: Dict[str, Dict[str, Any]] = {}
         reminders: Dict[str, Dict[str, Any]] = {}
-        for item_id, data in items.items():
-            stored = dict(data)
-            sched = stored.get("scheduled_time")
-            try:
-                from datetime import datetime
-                if isinstance(sched, datetime):
-                    stored["scheduled_time"] = sched.isoformat()
-                canonical = stored.get("scheduled_time_canonical")
-                if isinstance(canonical, datetime):
-                    stored["scheduled_time_canonical"] = canonical.isoformat()
-            except Exception:
-                pass
+        for item_id, stored in self._items.items():
             if stored.get("is_alarm"):
                 alarms[item_id] = stored
             else:
@@ -131,16 +189,12 @@ class AlarmReminderStorage:
             },
         }
 
-        await self._store.async_save(payload)
-        merged = {}
-        merged.update(alarms)
-        merged.update(reminders)
-        self._items = dict(merged)
         _LOGGER.debug(
             "AlarmReminderStorage saved: %d alarms + %d reminders",
             len(alarms),
             len(reminders),
         )
+        return payload
 
     @callback
     def async_get_item(self, item_id: str) -> Optional[Dict[str, Any]]:
@@ -159,13 +213,23 @@ class AlarmReminderStorage:
         async with self._lock:
             if item_id not in self._items:
                 return None
-            self._items[item_id].update(changes)
+            # Replace rather than mutate: a delayed write may be encoding the old copy
+            self._items[item_id] = {**self._items[item_id], **changes}
             await self._save_locked(self._items)
             return dict(self._items[item_id])
 
     async def async_delete_item(self, item_id: str) -> bool:
         """Delete an item and persist."""
         async with self._lock:
+            items_func = self._pending_items_func
+            if items_func is not None:
+                # A queued delayed save holds changes _items lacks, and the write below
+                # cancels it, so delete from its snapshot instead.
+                items = dict(items_func())
+                if items.pop(item_id, None) is None:
+                    return False
+                await self._save_locked(items)
+                return True
             if item_id in self._items:
                 del self._items[item_id]
                 await self._save_locked(self._items)
@@ -57,14 +57,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     @callback
     def _on_state_change(event):
         """Handle coordinator state change events: add/update/remove switches."""
-        eid = event.data.get("entity_id")
+        action = event.data.get("action", "updated")
+        # Batched updates carry entity_ids; single updates/removals carry entity_id
+        eids = event.data.get("entity_ids")
+        if eids is None:
+            eids = (event.data.get("entity_id"),)
+        for eid in eids:
+            _handle_entity_change(eid, action)
+
+    @callback
+    def _handle_entity_change(eid, action):
         if not eid or not (
             eid.startswith(f"{ALARM_ENTITY_DOMAIN}.")
             or eid.startswith(f"{REMINDER_ENTITY_DOMAIN}.")
         ):
             return
         item_id = eid.split(".")[-1]
-        action = event.data.get("action", "updated")
 
         if action == "removed":
             entity = entity_map.pop(item_id, None)
@@ -163,11 +171,11 @@ class AlarmItemSwitch(SwitchEntity):
         # set back to scheduled so coordinator will schedule it
         item["status"] = "scheduled"
         self.coordinator._active_items[self.item_id] = item
-        await self.coordinator.storage.async_save(self.coordinator._active_items)
+        self.coordinator._schedule_save()
         # ask coordinator to reschedule/resume
         await self.coordinator.reschedule_item(self.item_id, {}, item.get("is_alarm", False))
         self.coordinator._write_item_state(self.item_id)
-        self.coordinator._update_dashboard_state()
+        self.coordinator._schedule_refresh()
         # Update HA entity attributes/state
         self.async_write_ha_state()
 
@@ -180,7 +188,7 @@ class AlarmItemSwitch(SwitchEntity):
         item["enabled"] = False
         item["status"] = "disabled"
         self.coordinator._active_items[self.item_id] = item
-        await self.coordinator.storage.async_save(self.coordinator._active_items)
+        self.coordinator._schedule_save()
 
         # Best-effort: cancel scheduled triggers named trigger_<item_id>
         for task in asyncio.all_tasks():
@@ -191,7 +199,7 @@ class AlarmItemSwitch(SwitchEntity):
                 continue
 
         self.coordinator._write_item_state(self.item_id)
-        self.coordinator._update_dashboard_state()
+        self.coordinator._schedule_refresh()
         # Update HA entity attributes/state
         self.async_write_ha_state()
 